@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Řízení přístupu k API (rate limiting a limit souběžnosti)
+"""
+
+import math
+import time
+import threading
+from collections import OrderedDict
+
+class TokenBucket:
+    """Token bucket – průměrná rychlost rate/s, krátkodobě až burst požadavků"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self, now=None, cost=1):
+        """Odebere token; vrátí 0 při úspěchu, jinak sekundy do dalšího tokenu"""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+class RateLimiter:
+    """Token bucket pro každého klienta (sledovaných klientů je nejvýše max_clients)"""
+
+    def __init__(self, rate, burst, max_clients=10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets = OrderedDict()  # LRU {klíč klienta: TokenBucket}
+        self._lock = threading.Lock()
+
+    def check(self, key):
+        """Vrátí 0, pokud klient smí pokračovat, jinak doporučené čekání v sekundách"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket.take(now)
+
+class ConcurrencyLimiter:
+    """Globální limit souběžných požadavků s omezenou čekací frontou"""
+
+    def __init__(self, max_concurrency, max_queue, queue_timeout):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Získá slot; vrátí None, nebo důvod odmítnutí ('queue_full' / 'timeout')"""
+        with self._cond:
+            if self.in_flight < self.max_concurrency and not self.waiting:
+                self.in_flight += 1
+                return None
+
+            # Plná fronta – okamžité odmítnutí místo neomezeného čekání
+            if self.waiting >= self.max_queue:
+                return 'queue_full'
+
+            self.waiting += 1
+            deadline = time.monotonic() + self.queue_timeout
+            try:
+                while self.in_flight >= self.max_concurrency:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return 'timeout'
+                    self._cond.wait(remaining)
+                self.in_flight += 1
+                return None
+            finally:
+                self.waiting -= 1
+
+    def release(self):
+        """Uvolní slot a probudí jednoho čekajícího"""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+class AdmissionController:
+    """Rate limiting podle klienta + globální limit souběžnosti + metriky"""
+
+    def __init__(self, rate=20.0, burst=40, max_concurrency=8, max_queue=64,
+                 queue_timeout=2.0, max_clients=10000):
+        self.rate_limiter = RateLimiter(rate, burst, max_clients)
+        self.concurrency = ConcurrencyLimiter(max_concurrency, max_queue, queue_timeout)
+        self._lock = threading.Lock()
+        self.metrics = {
+            'admitted': 0,
+            'rejected_rate_limit': 0,
+            'rejected_queue_full': 0,
+            'rejected_timeout': 0,
+            'max_queue_depth': 0
+        }
+
+    def _count(self, name):
+        with self._lock:
+            self.metrics[name] += 1
+            self.metrics['max_queue_depth'] = max(self.metrics['max_queue_depth'],
+                                                  self.concurrency.waiting)
+
+    def admit(self, key):
+        """Vrátí None (přijato – nutno zavolat release), nebo (HTTP status, Retry-After)"""
+        wait = self.rate_limiter.check(key)
+        if wait > 0:
+            self._count('rejected_rate_limit')
+            return 429, max(1, math.ceil(wait))
+
+        reason = self.concurrency.acquire()
+        if reason is not None:
+            self._count('rejected_' + reason)
+            return 503, max(1, math.ceil(self.concurrency.queue_timeout))
+
+        self._count('admitted')
+        return None
+
+    def release(self):
+        self.concurrency.release()
+
+    def stats(self):
+        """Vrátí metriky (počty přijetí/odmítnutí, hloubka fronty)"""
+        with self._lock:
+            stats = dict(self.metrics)
+        stats['in_flight'] = self.concurrency.in_flight
+        stats['queue_depth'] = self.concurrency.waiting
+        return stats
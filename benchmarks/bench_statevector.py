@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Benchmark propustnosti bran statevector simulátoru
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from statevector import StatevectorSimulator, SQRT1_2
+
+
+def check_correctness(trials=200, seed=0):
+    """Kontrola malých registrů (1–2 qubity), kde jsou řezy tenzoru 1-D"""
+    sim = StatevectorSimulator(seed=seed)
+    sim.create_qubit('a', state=0)
+    sim.apply_gate('X', 'a')
+    assert np.allclose(sim.amplitudes, [0, 1]), "X na 1 qubitu nepřeklopil |0> na |1>"
+
+    sim.create_qubit('b', state=0)
+    sim.cnot('a', 'b')
+    assert np.argmax(np.abs(sim.amplitudes)) == 0b11, "X + CNOT nedal |11>"
+
+    for trial in range(trials):
+        sim.reset()
+        sim.create_qubit('a', state=0)
+        sim.create_qubit('b', state=0)
+        sim.entangle('a', 'b')
+        assert np.allclose(sim.amplitudes, [SQRT1_2, 0, 0, SQRT1_2]), "Bellův stav má špatné amplitudy"
+        assert sim.measure('a') == sim.measure('b'), "Qubity Bellova páru naměřeny různě"
+
+
+def bench_gates(num_qubits, repeats, seed=0):
+    """Změří počet bran za sekundu pro registr dané velikosti"""
+    sim = StatevectorSimulator(seed=seed)
+    for i in range(num_qubits):
+        sim.create_qubit(i, state=0)
+
+    results = {}
+    cases = {
+        'h': lambda q: sim.apply_gate('H', q),
+        'cnot': lambda q: sim.cnot(q, (q + 1) % num_qubits),
+        'swap': lambda q: sim.swap(q, (q + 1) % num_qubits),
+    }
+    for name, apply in cases.items():
+        if num_qubits < 2 and name != 'h':
+            continue
+        start = time.perf_counter()
+        for r in range(repeats):
+            apply(r % num_qubits)
+        elapsed = time.perf_counter() - start
+        results[name] = repeats / elapsed
+
+    start = time.perf_counter()
+    sim.sample(1000)
+    results['sample_1000'] = 1 / (time.perf_counter() - start)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Propustnost bran podle počtu qubitů")
+    parser.add_argument('--min-qubits', type=int, default=4)
+    parser.add_argument('--max-qubits', type=int, default=20)
+    parser.add_argument('--step', type=int, default=2)
+    parser.add_argument('--repeats', type=int, default=50)
+    parser.add_argument('--output', help="Soubor pro výsledky v JSON")
+    args = parser.parse_args()
+
+    check_correctness()
+    print("✅ Kontrola správnosti (1–2 qubity) prošla")
+
+    records = []
+    for n in range(args.min_qubits, args.max_qubits + 1, args.step):
+        rates = bench_gates(n, args.repeats)
+        records.append({'qubits': n, 'ops_per_sec': rates})
+        print(f"{n:>3} qubitů | " + " | ".join(f"{k}: {v:,.0f}/s" for k, v in rates.items()))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'benchmark': 'statevector_gates', 'results': records}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
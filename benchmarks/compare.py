@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Porovnání dvou běhů benchmarků (hledání regresí)
+"""
+
+import sys
+import json
+import argparse
+
+def load(path):
+    with open(path) as f:
+        report = json.load(f)
+    return {(r['benchmark'], r['scale']): r for r in report['results']}
+
+def compare(baseline, current, threshold):
+    """Vrátí řádky porovnání a seznam regresí (pomalejší o více než threshold %)"""
+    rows = []
+    regressions = []
+    for key in sorted(set(baseline) & set(current)):
+        before = baseline[key]['ops_per_sec']
+        after = current[key]['ops_per_sec']
+        change = (after / before - 1) * 100 if before else 0.0
+        regressed = change < -threshold
+        rows.append((key, before, after, change, regressed))
+        if regressed:
+            regressions.append(key)
+    return rows, regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Porovná výsledky benchmarků a označí regrese")
+    parser.add_argument('baseline', help="JSON s výchozími výsledky")
+    parser.add_argument('current', help="JSON s novými výsledky")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="regrese = propustnost nižší o více než toto procento")
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    current = load(args.current)
+    rows, regressions = compare(baseline, current, args.threshold)
+
+    for (name, scale), before, after, change, regressed in rows:
+        mark = '❌' if regressed else ('🚀' if change > args.threshold else '  ')
+        print(f"{mark} {name:<30} {scale:>9}  {before:>14,.1f} → {after:>14,.1f} op/s  {change:+7.1f} %")
+
+    missing = sorted(set(baseline) - set(current))
+    for name, scale in missing:
+        print(f"⚠️  {name:<30} {scale:>9}  chybí v novém běhu")
+
+    if regressions:
+        print(f"\n❌ Regrese: {len(regressions)} (práh {args.threshold:g} %)")
+        sys.exit(1)
+    print(f"\n✅ Bez regresí (práh {args.threshold:g} %)")
+
+if __name__ == "__main__":
+    main()
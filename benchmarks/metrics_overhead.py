@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Režie instrumentace metrik na horkých cestách (cíl < 1 %)
+
+Rozdíl dvou běhů (metriky zapnuté/vypnuté) je na sdíleném stroji pod úrovní
+šumu, proto se režie měří po složkách – cena rozhodnutí o vzorkování, cena
+vzorkovaného měření a vrstvy volání – a porovná s cenou samotné funkce.
+"""
+
+import os
+import sys
+import time
+import timeit
+import argparse
+import itertools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metrics
+from memory import StringMemory
+from run import _bulk_network
+
+TARGET = 0.01
+
+def _best(stmt, number, repeat=7, globals=None):
+    return min(timeit.repeat(stmt, number=number, repeat=repeat, globals=globals)) / number
+
+def instrumentation_costs():
+    """Cena jednoho rozhodnutí o vzorkování a jednoho vzorkovaného měření (sekundy)"""
+    scope = {'metrics': metrics, 'sampler': metrics.sampler(), 'time': time,
+             'histogram': metrics.Histogram('overhead_seconds', 'režie')}
+    check = _best('next(sampler)', 10**6, globals=scope)
+    sample = _best('s = time.perf_counter(); histogram.observe(time.perf_counter() - s, metrics.SAMPLE_EVERY)',
+                   10**6, globals=scope)
+    return check, sample
+
+def main():
+    parser = argparse.ArgumentParser(description="Režie metrik vůči ceně horkých cest")
+    parser.add_argument('--scales', default='100,1000', help="velikosti sítě pro process_transaction")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if not metrics.ENABLED:
+        print("Metriky jsou vypnuté (NEUROSTRING_METRICS=0) – režie je nulová")
+        return
+
+    check, sample = instrumentation_costs()
+    per_path = check + sample / metrics.SAMPLE_EVERY
+    print(f"vzorkování 1 z {metrics.SAMPLE_EVERY}: rozhodnutí {check * 1e9:.0f} ns, "
+          f"měření {sample * 1e9:.0f} ns")
+
+    rows = []
+    memory = StringMemory()
+    counter = itertools.count()
+    store = _best(lambda: memory.store(f"vzor_{next(counter)}"), 10000)
+    rows.append(('memory.store', store, per_path))
+
+    for scale in (int(float(part)) for part in args.scales.split(',') if part.strip()):
+        network = _bulk_network(scale, args.seed)
+        cost = _best(lambda: network.process_transaction(f"tx_{next(counter)}"), max(50, 20000 // scale), repeat=5)
+        # Transakce + šíření vzruchu (horní mez – šíří se jen při vystřelení uzlu)
+        rows.append((f'network.process_transaction@{scale}', cost, 2 * per_path))
+
+    failed = False
+    for name, cost, overhead in rows:
+        share = overhead / cost
+        failed |= share >= TARGET
+        print(f"{'❌' if share >= TARGET else '✅'} {name:<36} {cost * 1e6:>10.2f} µs  režie {overhead * 1e9:>5.0f} ns  {share:7.3%}")
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Sada benchmarků horkých cest (síť, paměť, kvantová simulace)
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from node import NeuroNode
+from network import NeuroNetwork
+from memory import StringMemory
+from quantum import QuantumSimulator
+from simulation import EventScheduler, LIFEngine
+
+DEFAULT_SCALES = '100,1000,10000'
+SYNAPSES_PER_NODE = 8  # průměrný stupeň uzlu v hromadně postavené síti
+
+def _seed(seed):
+    random.seed(seed)
+    np.random.seed(seed)
+
+def _bulk_network(size, seed):
+    """Síť postavená přímo (bez O(N²) add_node) – náhodný graf se stupněm ~8"""
+    _seed(seed)
+    network = NeuroNetwork()
+    nodes = [NeuroNode(node_id=f"node_{i}") for i in range(size)]
+    network.nodes = {node.node_id: node for node in nodes}
+
+    rng = np.random.default_rng(seed)
+    edges = size * SYNAPSES_PER_NODE // 2
+    sources = rng.integers(0, size, edges)
+    targets = rng.integers(0, size, edges)
+    strengths = rng.uniform(0.3, 0.7, edges)
+    for a, b, strength in zip(sources.tolist(), targets.tolist(), strengths.tolist()):
+        if a != b:
+            nodes[a].synapses[nodes[b].node_id] = strength
+            nodes[b].synapses[nodes[a].node_id] = strength
+    return network
+
+def _filled_memory(size, seed):
+    _seed(seed)
+    memory = StringMemory()
+    for i in range(size):
+        memory.store(f"vzor_{seed}_{i}")
+    return memory
+
+def _quantum(size, seed, pairs=0):
+    quantum = QuantumSimulator(seed=seed)
+    quantum.create_qubits(range(size))
+    rng = np.random.default_rng(seed)
+    for a, b in rng.integers(0, size, (pairs, 2)).tolist():
+        quantum.entangle(a, b)
+    return quantum
+
+# --- Jednotlivé benchmarky: setup(scale, seed) -> stav, body(stav, seed) -> počet operací ---
+
+def setup_add_node(scale, seed):
+    _seed(seed)
+    return [NeuroNode(node_id=f"node_{i}") for i in range(scale)]
+
+def bench_add_node(nodes, seed):
+    network = NeuroNetwork()
+    for node in nodes:
+        network.add_node(node)
+    return len(nodes)
+
+def bench_bulk_build(scale, seed):
+    _bulk_network(scale, seed)
+    return scale
+
+def bench_process_transaction(network, seed):
+    count = 200
+    for i in range(count):
+        network.process_transaction(f"bench_{seed}_{i}")
+    return count
+
+def setup_propagate(scale, seed):
+    network = _bulk_network(scale, seed)
+    random.seed(seed)
+    starts = random.sample(list(network.nodes), min(20, scale))
+    return network, starts
+
+def bench_propagate_spike(state, seed):
+    network, starts = state
+    for node_id in starts:
+        network._propagate_spike({'from': node_id}, node_id)
+    return len(starts)
+
+def bench_get_consensus(network, seed):
+    count = 10
+    for i in range(count):
+        network.get_consensus(i)
+    return count
+
+def bench_memory_store(scale, seed):
+    memory = StringMemory()
+    for i in range(scale):
+        memory.store(f"vzor_{seed}_{i}")
+    return scale
+
+def setup_memory_retrieve(scale, seed):
+    memory = _filled_memory(scale, seed)
+    random.seed(seed)
+    known = random.sample(list(memory.vibrations), min(1000, scale))
+    return memory, known
+
+def bench_memory_retrieve(state, seed):
+    memory, known = state
+    for fingerprint in known:
+        memory.retrieve(fingerprint)
+    # Neznámý otisk projde celou paměť (rezonanční hledání)
+    for i in range(10):
+        memory.retrieve(f"neznamy_{i}")
+    return len(known) + 10
+
+def bench_find_by_resonance(memory, seed):
+    count = 10
+    for i in range(count):
+        memory.find_by_resonance(0.3 + i * 0.04, tolerance=0.01)
+    return count
+
+def bench_get_dimension(memory, seed):
+    for dimension in range(memory.dimensions):
+        memory.get_dimension(dimension)
+    return memory.dimensions
+
+def bench_quantum_measure(state, seed):
+    quantum, qubit_ids = state
+    for qubit_id in qubit_ids:
+        quantum.measure(qubit_id)
+    return len(qubit_ids)
+
+def setup_quantum_measure(scale, seed):
+    quantum = _quantum(scale, seed, pairs=scale // 2)
+    qubit_ids = np.random.default_rng(seed).integers(0, scale, min(10000, scale)).tolist()
+    return quantum, qubit_ids
+
+def setup_quantum_entangle(scale, seed):
+    pairs = np.random.default_rng(seed).integers(0, scale, (scale, 2)).tolist()
+    return _quantum(scale, seed), pairs
+
+def bench_quantum_entangle(state, seed):
+    quantum, pairs = state
+    for a, b in pairs:
+        quantum.entangle(a, b)
+    return len(pairs)
+
+def setup_event_simulation(scale, seed):
+    network = _bulk_network(scale, seed)
+    scheduler = EventScheduler(network)
+    random.seed(seed)
+    for i, node_id in enumerate(random.choices(list(network.nodes), k=100)):
+        scheduler.inject(node_id, 1.0, delay=i * 5.0)
+    return scheduler
+
+def bench_event_simulation(scheduler, seed):
+    return scheduler.run_until(1000.0)
+
+def setup_lif(scale, seed):
+    engine = LIFEngine.random(scale, degree=SYNAPSES_PER_NODE, seed=seed)
+    # Řídká vnější aktivita – ~1 % uzlů dostane v každém kroku silný podnět
+    rng = np.random.default_rng(seed)
+    external = np.zeros(scale, dtype=np.float32)
+    external[rng.integers(0, scale, max(1, scale // 100))] = 1.0
+    engine.threshold = 2.0
+    return engine, external
+
+def bench_lif_step(state, seed):
+    engine, external = state
+    ticks = 20
+    engine.run(ticks, external)
+    return ticks
+
+# název: (setup, body, maximální rozumná velikost)
+BENCHMARKS = {
+    'network.add_node': (setup_add_node, bench_add_node, 10**4),
+    'network.bulk_build': (lambda scale, seed: scale, bench_bulk_build, 10**6),
+    'network.process_transaction': (_bulk_network, bench_process_transaction, 10**5),
+    'network._propagate_spike': (setup_propagate, bench_propagate_spike, 10**5),
+    'network.get_consensus': (_bulk_network, bench_get_consensus, 10**6),
+    'memory.store': (lambda scale, seed: scale, bench_memory_store, 10**6),
+    'memory.retrieve': (setup_memory_retrieve, bench_memory_retrieve, 10**6),
+    'memory.find_by_resonance': (_filled_memory, bench_find_by_resonance, 10**6),
+    'memory.get_dimension': (_filled_memory, bench_get_dimension, 10**6),
+    'quantum.measure': (setup_quantum_measure, bench_quantum_measure, 10**6),
+    'quantum.entangle': (setup_quantum_entangle, bench_quantum_entangle, 10**6),
+    'simulation.run_until': (setup_event_simulation, bench_event_simulation, 10**5),
+    'simulation.lif_step': (setup_lif, bench_lif_step, 10**6),
+}
+
+def run_benchmark(name, scale, seed, repeats):
+    """Spustí benchmark repeats-krát (setup se neměří), vrátí záznam výsledku"""
+    setup, body, _ = BENCHMARKS[name]
+    timings = []
+    for _ in range(repeats):
+        state = setup(scale, seed)
+        _seed(seed)
+        start = time.perf_counter()
+        ops = body(state, seed)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        'benchmark': name,
+        'scale': scale,
+        'ops': ops,
+        'seconds': best,
+        'median_seconds': statistics.median(timings),
+        'ops_per_sec': ops / best if best > 0 else float('inf')
+    }
+
+def _parse_scales(text):
+    return [int(float(part)) for part in text.split(',') if part.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarky horkých cest NeuroStringu")
+    parser.add_argument('--scales', default=DEFAULT_SCALES,
+                        help="velikosti oddělené čárkou, např. 1e2,1e3,1e4,1e5,1e6")
+    parser.add_argument('--only', help="jen benchmarky obsahující tento text")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--max-scale', type=float, default=None,
+                        help="přeskočí velikosti nad touto mezí (přebíjí výchozí meze benchmarků)")
+    parser.add_argument('--output', default='bench_output.json')
+    args = parser.parse_args()
+
+    results = []
+    for name, (_, _, limit) in BENCHMARKS.items():
+        if args.only and args.only not in name:
+            continue
+        limit = args.max_scale if args.max_scale is not None else limit
+        for scale in _parse_scales(args.scales):
+            if scale > limit:
+                print(f"{name:<30} {scale:>9}  přeskočeno (mez {int(limit)})")
+                continue
+            record = run_benchmark(name, scale, args.seed, args.repeats)
+            results.append(record)
+            print(f"{name:<30} {scale:>9}  {record['ops_per_sec']:>14,.1f} op/s  "
+                  f"({record['seconds'] * 1000:.2f} ms)", flush=True)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'repeats': args.repeats
+        },
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Výsledky uloženy do {args.output}")
+
+if __name__ == "__main__":
+    main()
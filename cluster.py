@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Lokální cluster více procesů (binární protokol přes TCP)
+
+Každý proces (peer) hostí vlastní sadu uzlů a s ostatními peery si po
+trvalých TCP spojeních vyměňuje vzruchy, změny synapsí a hlasy konsenzu.
+
+Rámec:  | délka payloadu: uint32 | typ: uint8 | payload |   (síťové pořadí bajtů)
+"""
+
+import sys
+import time
+import queue
+import random
+import socket
+import struct
+import threading
+import multiprocessing
+import numpy as np
+from node import NeuroNode
+from network import NeuroNetwork
+
+# Typy zpráv
+MSG_HELLO = 1
+MSG_SPIKE = 2
+MSG_SYNAPSE = 3
+MSG_VOTE = 4
+
+HEADER = struct.Struct('!IB')
+# HELLO: peer
+HELLO = struct.Struct('!H')
+# SPIKE: čas odeslání (monotonic_ns), zdroj (peer, uzel), cíl (peer, uzel), síla, TTL
+SPIKE = struct.Struct('!QHIHIfB')
+# SYNAPSE: zdroj (peer, uzel), cíl (peer, uzel), nová síla
+SYNAPSE = struct.Struct('!HIHIf')
+# VOTE: kolo, peer, podíl souhlasných hlasů, počet hlasujících uzlů
+VOTE = struct.Struct('!IHfI')
+
+PAYLOADS = {MSG_HELLO: HELLO, MSG_SPIKE: SPIKE, MSG_SYNAPSE: SYNAPSE, MSG_VOTE: VOTE}
+
+FLUSH_BYTES = 64 * 1024  # při zaplnění bufferu se flusher probudí hned, jinak po FLUSH_INTERVAL
+FLUSH_INTERVAL = 0.001
+MAX_BACKLOG = 4 * 1024 * 1024  # nad tímto objemem neodeslaných dat generátor zátěže čeká
+RECV_BUFFER = 256 * 1024
+SYNC_TIMEOUT = 60.0  # max. čekání peerů na sebe navzájem (start, spojení, konec zátěže)
+ABORTED_EXIT = 2     # návratový kód peera ukončeného kvůli selhání jiného peera
+
+def encode(msg_type, *fields):
+    """Zakóduje zprávu do rámce (hlavička + payload)"""
+    payload = PAYLOADS[msg_type]
+    return HEADER.pack(payload.size, msg_type) + payload.pack(*fields)
+
+class FrameReader:
+    """Inkrementální dekodér rámců z proudu bajtů"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        """Přidá přijatá data a vrátí seznam kompletních zpráv (typ, pole)"""
+        buffer = self._buffer
+        buffer += data
+        messages = []
+        offset = 0
+        while len(buffer) - offset >= HEADER.size:
+            length, msg_type = HEADER.unpack_from(buffer, offset)
+            end = offset + HEADER.size + length
+            if end > len(buffer):
+                break
+            payload = PAYLOADS.get(msg_type)
+            if payload is not None and payload.size == length:
+                messages.append((msg_type, payload.unpack_from(buffer, offset + HEADER.size)))
+            offset = end
+        del buffer[:offset]
+        return messages
+
+class ConnectionPool:
+    """Trvalá odchozí spojení na peery s dávkovým zápisem
+
+    send() jen připojí rámec do bufferu a nikdy neblokuje na socketu – čtecí
+    vlákna tak vždy odčerpávají svá spojení a dva peery se nemohou zablokovat
+    vzájemným zápisem. Do socketů zapisuje flusher (buffer vymění pod zámkem,
+    sendall volá mimo něj).
+    """
+
+    def __init__(self, peer_id, flush_interval=FLUSH_INTERVAL):
+        self.peer_id = peer_id
+        self.flush_interval = flush_interval
+        self.bytes_sent = 0
+        self._sockets = {}       # {peer: socket}
+        self._buffers = {}       # {peer: bytearray}
+        self._locks = {}         # {peer: Lock} – jen pro buffer
+        self._write_locks = {}   # {peer: Lock} – serializuje sendall na jeden socket
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name='cluster-flush', daemon=True)
+
+    def connect(self, peer, address, retries=50, delay=0.05):
+        """Naváže spojení (s opakováním, než peer začne naslouchat)"""
+        for attempt in range(retries):
+            try:
+                sock = socket.create_connection(address)
+                break
+            except OSError:
+                if attempt == retries - 1:
+                    raise
+                time.sleep(delay)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.sendall(encode(MSG_HELLO, self.peer_id))
+        self._sockets[peer] = sock
+        self._buffers[peer] = bytearray()
+        self._locks[peer] = threading.Lock()
+        self._write_locks[peer] = threading.Lock()
+        if not self._flusher.is_alive():
+            self._flusher.start()
+
+    @property
+    def peers(self):
+        return list(self._sockets)
+
+    def send(self, peer, frame):
+        """Zařadí rámec do bufferu peera (zápis proběhne dávkově ve flusheru)"""
+        with self._locks[peer]:
+            buffer = self._buffers[peer]
+            buffer += frame
+            full = len(buffer) >= FLUSH_BYTES
+        if full:
+            self._wake.set()
+
+    def broadcast(self, frame):
+        for peer in self._sockets:
+            self.send(peer, frame)
+
+    def backlog(self):
+        """Objem dat čekajících na odeslání (bajty)"""
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def flush(self):
+        """Odešle buffery všech peerů – volat jen mimo čtecí vlákna (blokuje na socketu)"""
+        for peer, sock in self._sockets.items():
+            with self._write_locks[peer]:
+                with self._locks[peer]:
+                    data = self._buffers[peer]
+                    if not data:
+                        continue
+                    self._buffers[peer] = bytearray()
+                sock.sendall(data)
+                self.bytes_sent += len(data)
+
+    def _flush_loop(self):
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except OSError:
+                break
+
+    def close(self):
+        self._closed.set()
+        self._wake.set()
+        try:
+            self.flush()
+        except OSError:
+            pass
+        for sock in self._sockets.values():
+            sock.close()
+
+class ClusterPeer:
+    """Jeden proces clusteru – lokální uzly + spojení na ostatní peery"""
+
+    def __init__(self, peer_id, addresses, nodes=100, remote_synapses=4,
+                 threshold=0.8, ttl=2, seed=None):
+        self.peer_id = peer_id
+        self.addresses = addresses       # [(host, port)] pro všechny peery
+        self.threshold = threshold
+        self.ttl = ttl
+        self.rng = random.Random(seed)
+
+        self.network = NeuroNetwork()
+        self.local_nodes = [NeuroNode(node_id=f"p{peer_id}_node_{i}") for i in range(nodes)]
+        for node in self.local_nodes:
+            self.network.add_node(node)
+
+        # Synapse na uzly jiných peerů {lokální index: {(peer, uzel): síla}}
+        others = [p for p in range(len(addresses)) if p != peer_id]
+        self.remote_synapses = {}
+        for i in range(nodes):
+            targets = {}
+            for _ in range(remote_synapses if others else 0):
+                targets[(self.rng.choice(others), self.rng.randrange(nodes))] = self.rng.uniform(0.3, 0.7)
+            self.remote_synapses[i] = targets
+
+        self.pool = ConnectionPool(peer_id)
+        self.sent = {MSG_SPIKE: 0, MSG_SYNAPSE: 0, MSG_VOTE: 0}
+        self.received = {MSG_SPIKE: 0, MSG_SYNAPSE: 0, MSG_VOTE: 0}
+        self.latencies_ns = []
+        self.consensus = []              # [(kolo, podíl souhlasu)] dokončených kol
+        self._votes = {}                 # {kolo: [(podíl, počet)]}
+        self._lock = threading.Lock()
+        self._server = None
+        self._readers = []
+
+    # --- Síť ---
+
+    def listen(self):
+        """Začne přijímat spojení od ostatních peerů"""
+        self._server = socket.create_server(self.addresses[self.peer_id])
+        threading.Thread(target=self._accept_loop, name='cluster-accept', daemon=True).start()
+
+    def connect_all(self):
+        for peer, address in enumerate(self.addresses):
+            if peer != self.peer_id:
+                self.pool.connect(peer, address)
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            reader = threading.Thread(target=self._read_loop, args=(conn,), name='cluster-read', daemon=True)
+            reader.start()
+            self._readers.append(reader)
+
+    def _read_loop(self, conn):
+        reader = FrameReader()
+        buffer = bytearray(RECV_BUFFER)
+        view = memoryview(buffer)
+        with conn:
+            while True:
+                try:
+                    received = conn.recv_into(buffer)
+                except OSError:
+                    return
+                if not received:
+                    return
+                for msg_type, fields in reader.feed(view[:received]):
+                    self._dispatch(msg_type, fields)
+
+    def _dispatch(self, msg_type, fields):
+        if msg_type == MSG_SPIKE:
+            self._on_spike(*fields)
+        elif msg_type == MSG_SYNAPSE:
+            self._on_synapse(*fields)
+        elif msg_type == MSG_VOTE:
+            self._on_vote(*fields)
+
+    # --- Zprávy ---
+
+    def _count_sent(self, msg_type, count=1):
+        with self._lock:
+            self.sent[msg_type] += count
+
+    def send_spike(self, src_node, dst_peer, dst_node, strength, ttl=None):
+        frame = encode(MSG_SPIKE, time.monotonic_ns(), self.peer_id, src_node,
+                       dst_peer, dst_node, strength, self.ttl if ttl is None else ttl)
+        self.pool.send(dst_peer, frame)
+        self._count_sent(MSG_SPIKE)
+
+    def fire(self, local_index, ttl=None):
+        """Uzel vyšle vzruch – lokálně i přes synapse na ostatní peery"""
+        node = self.local_nodes[local_index]
+        with self.network.lock:
+            node.activation_potential = 0.1
+            node.spike_count += 1
+            self.network._propagate_spike({'from': node.node_id}, node.node_id)
+        ttl = self.ttl if ttl is None else ttl
+        for (peer, remote_node), strength in self.remote_synapses[local_index].items():
+            self.send_spike(local_index, peer, remote_node, strength, ttl)
+
+    def _on_spike(self, sent_ns, src_peer, src_node, dst_peer, dst_node, strength, ttl):
+        # monotonic_ns je na jednom stroji společné pro všechny procesy
+        latency = time.monotonic_ns() - sent_ns
+        with self._lock:
+            self.received[MSG_SPIKE] += 1
+            self.latencies_ns.append(latency)
+
+        if dst_peer != self.peer_id or dst_node >= len(self.local_nodes):
+            return
+        node = self.local_nodes[dst_node]
+        with self.network.lock:
+            node.activation_potential += strength
+            fired = node.activation_potential > self.threshold
+        if fired:
+            # Úspěšný přenos – posílí se synapse u odesílatele (Hebbovské učení)
+            self.pool.send(src_peer, encode(MSG_SYNAPSE, src_peer, src_node, self.peer_id, dst_node,
+                                            min(1.0, strength + node.learning_rate)))
+            self._count_sent(MSG_SYNAPSE)
+            if ttl > 1:
+                self.fire(dst_node, ttl - 1)
+
+    def _on_synapse(self, src_peer, src_node, dst_peer, dst_node, strength):
+        with self._lock:
+            self.received[MSG_SYNAPSE] += 1
+        if src_peer == self.peer_id and src_node in self.remote_synapses:
+            synapses = self.remote_synapses[src_node]
+            if (dst_peer, dst_node) in synapses:
+                synapses[(dst_peer, dst_node)] = strength
+
+    def vote(self, round_id):
+        """Odhlasuje kolo konsenzu lokálními uzly a pošle výsledek ostatním"""
+        with self.network.lock:
+            votes = [node.activation_potential * self.rng.uniform(0.8, 1.2) > 0.5
+                     for node in self.local_nodes]
+        agreement = sum(votes) / len(votes) if votes else 0.0
+        self.pool.broadcast(encode(MSG_VOTE, round_id, self.peer_id, agreement, len(votes)))
+        self._count_sent(MSG_VOTE, len(self.pool.peers))
+        self._record_vote(round_id, agreement, len(votes))
+
+    def _on_vote(self, round_id, peer, agreement, voters):
+        with self._lock:
+            self.received[MSG_VOTE] += 1
+        self._record_vote(round_id, agreement, voters)
+
+    def _record_vote(self, round_id, agreement, voters):
+        with self._lock:
+            votes = self._votes.setdefault(round_id, [])
+            votes.append((agreement, voters))
+            if len(votes) == len(self.addresses):
+                total = sum(count for _, count in votes)
+                overall = sum(a * count for a, count in votes) / total if total else 0.0
+                self.consensus.append((round_id, overall))
+                del self._votes[round_id]
+
+    # --- Zátěž a výsledky ---
+
+    def generate_traffic(self, duration, rate=0, consensus_interval=0.1):
+        """Posílá vzruchy z náhodných lokálních uzlů (rate = vzruchů/s, 0 = maximum)"""
+        interval = 1.0 / rate if rate else 0
+        started = time.perf_counter()
+        next_vote = started
+        round_id = 0
+        count = 0
+        while True:
+            now = time.perf_counter()
+            if now - started >= duration:
+                break
+            if now >= next_vote:
+                self.vote(round_id)
+                round_id += 1
+                next_vote += consensus_interval
+            if interval:
+                scheduled = started + count * interval
+                if scheduled > now:
+                    time.sleep(scheduled - now)
+            # Zpětný tlak jen na generátor – čtecí vlákna nikdy nečekají
+            while self.pool.backlog() > MAX_BACKLOG:
+                time.sleep(self.pool.flush_interval)
+            self.fire(self.rng.randrange(len(self.local_nodes)), ttl=self.ttl)
+            count += 1
+        self.pool.flush()
+
+    def drain(self, quiet=0.2, timeout=10.0):
+        """Počká, než dorazí zprávy ještě na cestě (žádný příjem po dobu quiet)"""
+        deadline = time.perf_counter() + timeout
+        last = -1
+        while time.perf_counter() < deadline:
+            with self._lock:
+                current = sum(self.received.values())
+            if current == last:
+                return
+            last = current
+            time.sleep(quiet)
+
+    def report(self, elapsed):
+        with self._lock:
+            latencies = np.array(self.latencies_ns, dtype=np.float64) / 1000.0
+            return {
+                'peer': self.peer_id,
+                'sent': dict(self.sent),
+                'received': dict(self.received),
+                'bytes_sent': self.pool.bytes_sent,
+                'elapsed': elapsed,
+                'latencies_us': latencies,
+                'consensus_rounds': len(self.consensus)
+            }
+
+    def close(self):
+        self.pool.close()
+        if self._server is not None:
+            self._server.close()
+
+def _peer_main(peer_id, addresses, nodes, duration, rate, seed, barrier, results):
+    """Vstupní bod procesu peera"""
+    peer = None
+    try:
+        peer = ClusterPeer(peer_id, addresses, nodes=nodes, seed=None if seed is None else seed + peer_id)
+        peer.listen()
+        barrier.wait()
+        peer.connect_all()
+        barrier.wait()
+
+        started = time.perf_counter()
+        peer.generate_traffic(duration, rate)
+        barrier.wait()
+        peer.drain()
+        results.put(peer.report(time.perf_counter() - started))
+        barrier.wait()
+    except threading.BrokenBarrierError:
+        # Selhal jiný peer (nebo vypršel čas) – příčinu hlásí on
+        sys.exit(ABORTED_EXIT)
+    except BaseException:
+        # Ostatní peery nesmí čekat na bariéře donekonečna
+        barrier.abort()
+        raise
+    finally:
+        if peer is not None:
+            peer.close()
+
+def _stop(processes):
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    for process in processes:
+        process.join()
+
+def launch(peers=4, nodes=100, duration=5.0, rate=100, host='127.0.0.1', base_port=7100, seed=None):
+    """Spustí peers procesů na jednom stroji a vrátí souhrnné měření
+
+    Selže-li některý peer, ostatní se ukončí a vyhodí se RuntimeError.
+    """
+    addresses = [(host, base_port + i) for i in range(peers)]
+    barrier = multiprocessing.Barrier(peers, timeout=SYNC_TIMEOUT)
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_peer_main, name=f"neurostring-peer-{i}",
+                                         args=(i, addresses, nodes, duration, rate, seed, barrier, results))
+                 for i in range(peers)]
+    for process in processes:
+        process.start()
+
+    # Horní mez: synchronizace + zátěž + doběhnutí zpráv
+    limit = duration + 4 * SYNC_TIMEOUT
+    deadline = time.monotonic() + limit
+    reports = []
+    while len(reports) < peers:
+        try:
+            reports.append(results.get(timeout=0.5))
+            continue
+        except queue.Empty:
+            pass
+        failed = [(i, process.exitcode) for i, process in enumerate(processes)
+                  if process.exitcode not in (None, 0)]
+        if failed:
+            _stop(processes)
+            # Přednostně peery, které selhaly samy (ne kvůli přerušené bariéře)
+            failed = [item for item in failed if item[1] != ABORTED_EXIT] or failed
+            details = ', '.join(f"peer {i} (port {addresses[i][1]}) kód {code}" for i, code in failed)
+            raise RuntimeError(f"Cluster selhal: {details}")
+        if time.monotonic() > deadline:
+            _stop(processes)
+            raise RuntimeError(f"Cluster nedoběhl do {limit:.0f} s")
+
+    for process in processes:
+        process.join(SYNC_TIMEOUT)
+    _stop(processes)
+
+    return summarize(sorted(reports, key=lambda r: r['peer']))
+
+def summarize(reports):
+    """Souhrn: zprávy za sekundu a latence vzruchů mezi peery (µs)"""
+    elapsed = max(r['elapsed'] for r in reports)
+    received = sum(sum(r['received'].values()) for r in reports)
+    sent = sum(sum(r['sent'].values()) for r in reports)
+    latencies = np.concatenate([r['latencies_us'] for r in reports])
+    summary = {
+        'peers': len(reports),
+        'messages_sent': sent,
+        'messages_received': received,
+        'messages_per_sec': round(received / elapsed, 1) if elapsed else 0,
+        'megabytes_sent': round(sum(r['bytes_sent'] for r in reports) / 1e6, 2),
+        'consensus_rounds': min(r['consensus_rounds'] for r in reports),
+        'spike_latency_us': {}
+    }
+    if latencies.size:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        summary['spike_latency_us'] = {'p50': round(float(p50), 1),
+                                       'p95': round(float(p95), 1),
+                                       'p99': round(float(p99), 1)}
+    return summary
+
+def print_summary(summary):
+    """Vypíše souhrn měření clusteru"""
+    print("\n" + "="*50)
+    print("🛰️  CLUSTER")
+    print("="*50)
+    print(f"Peerů: {summary['peers']}")
+    print(f"Zpráv odesláno / přijato: {summary['messages_sent']} / {summary['messages_received']}")
+    print(f"Propustnost: {summary['messages_per_sec']:,.1f} zpráv/s ({summary['megabytes_sent']} MB)")
+    print(f"Dokončená kola konsenzu: {summary['consensus_rounds']}")
+    latency = summary['spike_latency_us']
+    if latency:
+        print(f"Latence vzruchu: p50 {latency['p50']} µs | p95 {latency['p95']} µs | p99 {latency['p99']} µs")
+    print("="*50 + "\n")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Generátor zátěže (transakce, připojení/odpojení uzlů, konsenzus)
+"""
+
+import time
+import random
+import threading
+import multiprocessing
+import numpy as np
+from node import NeuroNode
+from network import NeuroNetwork
+
+DEFAULT_MIX = 'transaction=90,join=4,leave=3,consensus=3'
+OPERATIONS = ('transaction', 'join', 'leave', 'consensus')
+MIN_NODES = 2  # odpojování nesmí síť vyprázdnit
+
+def parse_mix(text):
+    """Převede 'transaction=90,join=5' na (operace, váhy)"""
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Neznámá operace: {name} (povolené: {', '.join(OPERATIONS)})")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("Mix musí obsahovat alespoň jednu operaci s kladnou váhou")
+    return list(mix), list(mix.values())
+
+def build_network(size, seed=None):
+    """Vytvoří síť o size uzlech"""
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+    network = NeuroNetwork()
+    for i in range(size):
+        network.add_node(NeuroNode(node_id=f"node_{i}"))
+    network.activate_quantum_entanglement()
+    return network
+
+def _run_operation(network, operation, rng, counter):
+    if operation == 'transaction':
+        network.process_transaction(f"loadgen_{counter}_{rng.random()}")
+    elif operation == 'join':
+        network.add_node(NeuroNode())
+    elif operation == 'leave':
+        with network.lock:
+            if len(network.nodes) > MIN_NODES:
+                network.remove_node(rng.choice(list(network.nodes)))
+    elif operation == 'consensus':
+        network.get_consensus(counter)
+
+def _worker(network, operations, weights, duration, interval, seed, latencies):
+    """Jedno vlákno – operace podle mixu, volitelně v pevném tempu (open loop)"""
+    rng = random.Random(seed)
+    local = {operation: [] for operation in operations}
+    started = time.perf_counter()
+    deadline = started + duration
+    count = 0
+
+    while True:
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        operation = rng.choices(operations, weights)[0]
+        if interval:
+            # Plánovaný čas dalšího požadavku – při zpoždění se nečeká
+            scheduled = started + count * interval
+            if scheduled > now:
+                time.sleep(scheduled - now)
+            # Latence od plánovaného odeslání – zahrnuje i čekání ve frontě (coordinated omission)
+            begin = scheduled
+        else:
+            begin = time.perf_counter()
+
+        _run_operation(network, operation, rng, count)
+        local[operation].append(time.perf_counter() - begin)
+        count += 1
+
+    latencies.append((local, started, time.perf_counter()))
+
+def _run_threads(nodes, operations, weights, duration, rate, threads, seed):
+    """Spustí vlákna nad jednou sdílenou sítí, vrátí ({operace: pole latencí}, doba měření)"""
+    network = build_network(nodes, seed)
+    interval = threads / rate if rate else 0
+    latencies = []
+    workers = [threading.Thread(target=_worker,
+                                args=(network, operations, weights, duration, interval,
+                                      None if seed is None else seed + i, latencies))
+               for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    # Měřené okno je od startu prvního vlákna do konce posledního (bez stavby sítě)
+    elapsed = max(end for _, _, end in latencies) - min(start for _, start, _ in latencies)
+    return {operation: np.array([lat for local, _, _ in latencies for lat in local[operation]])
+            for operation in operations}, elapsed
+
+def _run_process(args):
+    return _run_threads(*args)
+
+def _summary(latencies, elapsed):
+    """Propustnost a percentily p50/p95/p99 (v milisekundách)"""
+    total = sum(len(values) for values in latencies.values())
+    report = {
+        'operations': total,
+        'elapsed': round(elapsed, 3),
+        'throughput': round(total / elapsed, 1) if elapsed > 0 else 0,
+        'by_operation': {}
+    }
+    everything = np.concatenate([values for values in latencies.values()]) if total else np.array([])
+    for name, values in list(latencies.items()) + [('all', everything)]:
+        if not len(values):
+            continue
+        p50, p95, p99 = np.percentile(values * 1000, [50, 95, 99])
+        report['by_operation'][name] = {
+            'count': int(len(values)),
+            'p50_ms': round(float(p50), 4),
+            'p95_ms': round(float(p95), 4),
+            'p99_ms': round(float(p99), 4)
+        }
+    return report
+
+def run(duration=10, rate=0, threads=1, processes=1, mix=DEFAULT_MIX, nodes=100, seed=None):
+    """Spustí zátěž; rate je celkový cíl operací za sekundu (0 = maximální rychlost)"""
+    operations, weights = parse_mix(mix)
+    per_process_rate = rate / processes if rate else 0
+
+    if processes <= 1:
+        latencies, elapsed = _run_threads(nodes, operations, weights, duration, per_process_rate, threads, seed)
+    else:
+        # Každý proces má vlastní síť – výsledky se sloučí
+        jobs = [(nodes, operations, weights, duration, per_process_rate, threads,
+                 None if seed is None else seed + 1000 * i) for i in range(processes)]
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_run_process, jobs)
+        latencies = {operation: np.concatenate([result[operation] for result, _ in results])
+                     for operation in operations}
+        # Procesy měří souběžně – rozhoduje nejdelší měřené okno (bez startu poolu)
+        elapsed = max(window for _, window in results)
+
+    return _summary(latencies, elapsed)
+
+def print_report(report):
+    """Vypíše výsledek zátěžového testu"""
+    print("\n" + "="*50)
+    print("🚦 VÝSLEDEK ZÁTĚŽE")
+    print("="*50)
+    print(f"Operací: {report['operations']} za {report['elapsed']} s")
+    print(f"Propustnost: {report['throughput']:,.1f} op/s")
+    for name, stats in report['by_operation'].items():
+        print(f"{name:<12} {stats['count']:>9}×  p50 {stats['p50_ms']:.3f} ms | "
+              f"p95 {stats['p95_ms']:.3f} ms | p99 {stats['p99_ms']:.3f} ms")
+    print("="*50 + "\n")
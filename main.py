@@ -6,10 +6,16 @@ NeuroString – Hlavní spouštěcí soubor
 import os
 import sys
 import time
+import signal
+import argparse
 from datetime import datetime
+from werkzeug.serving import make_server
 from node import NeuroNode
-from network import NeuroNetwork
+from network import network
 from web import app
+from profiler import profiler
+import loadgen
+import cluster
 import threading
 
 def print_logo():
@@ -40,8 +46,8 @@ def print_logo():
     print(f"📅 Spuštěno: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}")
     print(f"⚡ Stav: Neuronová síť aktivována\n")
 
-def main():
-    """Hlavní funkce"""
+def interactive():
+    """Interaktivní režim (logo + příkazová řádka)"""
     # Vymaž obrazovku
     os.system('cls' if os.name == 'nt' else 'clear')
     
@@ -50,7 +56,6 @@ def main():
     
     # Inicializuj síť
     print("🔄 Inicializuji NeuroString síť...")
-    network = NeuroNetwork()
     
     # Přidej první uzly
     print("🧠 Vytvářím první neurony...")
@@ -70,11 +75,11 @@ def main():
     web_thread.start()
     
     # Hlavní smyčka
-    print("\n📡 Síť běží. Příkazy: [T]ransakce, [S]tav, [I]nfo, [Q]uit\n")
+    print("\n📡 Síť běží. Příkazy: [T]ransakce, [S]tav, [I]nfo, [P]rofil [sekundy], [Q]uit\n")
     
     try:
         while True:
-            cmd = input("NeuroString> ").strip().upper()
+            cmd, *args = input("NeuroString> ").strip().upper().split() or [""]
             
             if cmd == "T":
                 # Simuluj transakci
@@ -105,17 +110,127 @@ def main():
                 print("🌌 Teorii strun - 11D úložiště")
                 print("="*50 + "\n")
                 
+            elif cmd == "P":
+                # Profilování běžícího procesu (vzorkování + alokace)
+                seconds = float(args[0]) if args and args[0].replace('.', '', 1).isdigit() else 10
+                if not profiler.start(seconds=seconds):
+                    print("⏳ Profilování už běží")
+                    continue
+                print(f"📈 Profiluji {seconds:g} s...")
+                try:
+                    result = profiler.wait()
+                except KeyboardInterrupt:
+                    result = profiler.stop()
+                if result is None or 'error' in result:
+                    print(f"❌ Profilování selhalo: {result['error'] if result else 'žádný výsledek'}")
+                    continue
+                print(f"✅ {result['samples']} vzorků → {result['stacks_file']}")
+                for item in result['allocations'][:5]:
+                    print(f"   {item['size_kb']:>10.1f} KiB  {item['location']}")
+                
             elif cmd == "Q":
                 print("\n👋 Ukončuji NeuroString...")
                 break
                 
             else:
-                print("❌ Neznámý příkaz. Zkuste T, S, I nebo Q.")
+                print("❌ Neznámý příkaz. Zkuste T, S, I, P nebo Q.")
                 
     except KeyboardInterrupt:
         print("\n\n👋 Ukončuji NeuroString...")
     
     print("✅ Hotovo.")
 
+def serve(args):
+    """Headless režim – síť + webové rozhraní, ukončení signálem SIGINT/SIGTERM"""
+    print(f"🔄 Inicializuji síť ({args.nodes} uzlů)...", flush=True)
+    for i in range(args.nodes):
+        network.add_node(NeuroNode(node_id=f"node_{i}"))
+    network.activate_quantum_entanglement()
+    
+    server = make_server(args.host, args.port, app, threaded=True)
+    
+    def shutdown(signum, frame):
+        print(f"\n👋 Signál {signal.Signals(signum).name} – ukončuji NeuroString...", flush=True)
+        # shutdown() čeká na konec serve_forever(), proto z jiného vlákna
+        threading.Thread(target=server.shutdown, daemon=True).start()
+    
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+    
+    print(f"🌐 NeuroString běží na http://{args.host}:{args.port}", flush=True)
+    server.serve_forever()
+    server.server_close()
+    
+    if profiler.running:
+        profiler.stop()
+    print("✅ Hotovo.", flush=True)
+
+def run_loadgen(args):
+    """Zátěžový test – mix operací, propustnost a percentily latence"""
+    print(f"🚦 Zátěž: {args.duration} s, {args.threads} vláken × {args.processes} procesů, "
+          f"tempo {'maximum' if not args.rate else f'{args.rate:g} op/s'}, mix {args.mix}")
+    report = loadgen.run(duration=args.duration, rate=args.rate, threads=args.threads,
+                         processes=args.processes, mix=args.mix, nodes=args.nodes, seed=args.seed)
+    loadgen.print_report(report)
+    
+    if args.output:
+        import json
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+def run_cluster(args):
+    """Lokální cluster více procesů – latence vzruchů mezi peery a propustnost zpráv"""
+    print(f"🛰️  Cluster: {args.peers} peerů × {args.nodes} uzlů, {args.duration} s, "
+          f"porty {args.base_port}–{args.base_port + args.peers - 1}")
+    try:
+        summary = cluster.launch(peers=args.peers, nodes=args.nodes, duration=args.duration, rate=args.rate,
+                                 host=args.host, base_port=args.base_port, seed=args.seed)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    cluster.print_summary(summary)
+
+def main(argv=None):
+    """Hlavní funkce – bez příkazu se spustí interaktivní režim"""
+    parser = argparse.ArgumentParser(prog='main.py', description="NeuroString")
+    commands = parser.add_subparsers(dest='command')
+    
+    serve_parser = commands.add_parser('serve', help="headless režim (služba)")
+    serve_parser.add_argument('--nodes', type=int, default=3, help="počet uzlů při startu")
+    serve_parser.add_argument('--host', default='0.0.0.0')
+    serve_parser.add_argument('--port', type=int, default=5000)
+    
+    load_parser = commands.add_parser('loadgen', help="generátor zátěže")
+    load_parser.add_argument('--nodes', type=int, default=100, help="počet uzlů v síti")
+    load_parser.add_argument('--duration', type=float, default=10, help="délka testu v sekundách")
+    load_parser.add_argument('--rate', type=float, default=0, help="cílové op/s (0 = maximum)")
+    load_parser.add_argument('--threads', type=int, default=1)
+    load_parser.add_argument('--processes', type=int, default=1)
+    load_parser.add_argument('--mix', default=loadgen.DEFAULT_MIX, help="např. transaction=90,join=5,leave=3,consensus=2")
+    load_parser.add_argument('--seed', type=int, default=None)
+    load_parser.add_argument('--output', help="uloží výsledek jako JSON")
+    
+    cluster_parser = commands.add_parser('cluster', help="lokální cluster více procesů přes TCP")
+    cluster_parser.add_argument('--peers', type=int, default=4, help="počet procesů")
+    cluster_parser.add_argument('--nodes', type=int, default=100, help="počet uzlů v každém procesu")
+    cluster_parser.add_argument('--duration', type=float, default=5, help="délka měření v sekundách")
+    cluster_parser.add_argument('--rate', type=float, default=100, help="vzruchů/s na peer (0 = maximum)")
+    cluster_parser.add_argument('--host', default='127.0.0.1')
+    cluster_parser.add_argument('--base-port', type=int, default=7100)
+    cluster_parser.add_argument('--seed', type=int, default=None)
+    
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        serve(args)
+    elif args.command == 'loadgen':
+        try:
+            run_loadgen(args)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.command == 'cluster':
+        run_cluster(args)
+    else:
+        interactive()
+
 if __name__ == "__main__":
     main()
@@ -3,9 +3,15 @@
 NeuroString – Strunná paměť (11D úložiště)
 """
 
+import time
 import hashlib
 import numpy as np
 import json
+import metrics
+
+STORE_SECONDS = metrics.histogram(
+    'neurostring_memory_store_seconds', 'Doba uložení vibračního vzoru (StringMemory.store, vzorkováno)')
+_store_sampler = metrics.sampler()
 
 class StringMemory:
     """Třída pro ukládání dat jako vibrační vzory v 11D prostoru"""
@@ -14,9 +20,15 @@ class StringMemory:
         self.vibrations = {}  # {fingerprint: vibration_data}
         self.dimensions = 11  # 11 dimenzí (10+1 čas)
         self.resonance_map = {}
+        self.version = 0  # Čítač změn (pro dashboard – ETag/SSE)
         
     def store(self, data):
         """Uloží data jako vibrační vzor"""
+        # Měří se jen každé N-té uložení (s vahou N) – obal by stál víc než 1 %
+        sampled = next(_store_sampler)
+        if sampled:
+            started = time.perf_counter()
+        
         # Vytvoř vibrační otisk
         vibration = self._data_to_vibration(data)
         
@@ -25,7 +37,10 @@ class StringMemory:
         
         # Aktualizuj rezonanční mapu
         self._update_resonance(vibration)
+        self.version += 1
         
+        if sampled:
+            STORE_SECONDS.observe(time.perf_counter() - started, metrics.SAMPLE_EVERY)
         return vibration['fingerprint']
     
     def retrieve(self, fingerprint):
@@ -140,6 +155,7 @@ class StringMemory:
         """Vymaže paměť"""
         self.vibrations = {}
         self.resonance_map = {}
+        self.version += 1
     
     def stats(self):
         """Vrátí statistiky paměti"""
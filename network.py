@@ -3,9 +3,46 @@
 NeuroString – Třída NeuroNetwork (správa sítě)
 """
 
+import time
 import random
+import functools
+import threading
+from collections import deque
 import numpy as np
+import metrics
 from node import NeuroNode
+from quantum import quantum
+
+# Kolik posledních transakcí se drží v paměti (historie je kruhový buffer)
+TRANSACTION_HISTORY_LIMIT = 10000
+
+# Metriky horkých cest
+# Vzorkování 1 z metrics.SAMPLE_EVERY – rozhodnutí stojí jediné next()
+_transaction_sampler = metrics.sampler()
+_spike_sampler = metrics.sampler()
+TRANSACTION_SECONDS = metrics.histogram(
+    'neurostring_transaction_seconds', 'Doba zpracování transakce (process_transaction, vzorkováno)')
+SPIKE_SECONDS = metrics.histogram(
+    'neurostring_spike_propagation_seconds', 'Doba šíření vzruchu sítí (_propagate_spike, vzorkováno)')
+SPIKE_NODES_REACHED = metrics.histogram(
+    'neurostring_spike_nodes_reached', 'Počet uzlů zasažených jedním vzruchem',
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 100000))
+SPIKE_FANOUT = metrics.histogram(
+    'neurostring_spike_synapses_examined', 'Fan-out šíření – počet synapsí prošlých jedním vzruchem',
+    buckets=(1, 5, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000, 1000000))
+CONSENSUS_SECONDS = metrics.histogram(
+    'neurostring_consensus_seconds', 'Doba hlasování o konsenzu (get_consensus)')
+CONSENSUS_AGREEMENT = metrics.histogram(
+    'neurostring_consensus_agreement', 'Podíl souhlasných hlasů v konsenzu',
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.67, 0.7, 0.8, 0.9, 1.0))
+
+def synchronized(method):
+    """Serializuje volání metody přes zámek sítě (web API běží ve více vláknech)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class NeuroNetwork:
     """Třída pro správu celé NeuroString sítě"""
@@ -13,14 +50,19 @@ class NeuroNetwork:
     def __init__(self):
         """Inicializace sítě"""
         self.nodes = {}  # {node_id: NeuroNode}
-        self.transaction_history = []
+        self.transaction_history = deque(maxlen=TRANSACTION_HISTORY_LIMIT)
+        self.transaction_count = 0
         self.entanglement_level = 0.0
         self.memory_patterns = 0
         self.consensus_threshold = 0.67  # 67% shoda pro konsenzus
+        self.version = 0  # Čítač změn (pro dashboard – ETag/SSE)
+        self.lock = threading.RLock()
         
+    @synchronized
     def add_node(self, node):
         """Přidá uzel do sítě a vytvoří synapse"""
         self.nodes[node.node_id] = node
+        self.version += 1
         
         # Vytvoř synapse s existujícími uzly
         for existing_node in self.nodes.values():
@@ -30,6 +72,7 @@ class NeuroNetwork:
                     node.add_synapse(existing_node.node_id)
                     existing_node.add_synapse(node.node_id)
     
+    @synchronized
     def remove_node(self, node_id):
         """Odstraní uzel ze sítě"""
         if node_id in self.nodes:
@@ -38,9 +81,12 @@ class NeuroNetwork:
                 if node_id in node.synapses:
                     node.remove_synapse(node_id)
             
-            # Smaž uzel
+            # Smaž uzel a uvolni jeho qubit
             del self.nodes[node_id]
+            self.version += 1
+            quantum.release_qubit(node_id)
     
+    @synchronized
     def activate_quantum_entanglement(self):
         """Aktivuje kvantové provázání mezi uzly"""
         if len(self.nodes) < 2:
@@ -58,17 +104,25 @@ class NeuroNetwork:
                     pairs += 1
         
         self.entanglement_level = pairs / total_possible if total_possible > 0 else 0
+        self.version += 1
     
-    def process_transaction(self, data):
+    @synchronized
+    def process_transaction(self, data, start_node=None):
         """Zpracuje transakci v síti"""
         if not self.nodes:
             return "❌ Žádné uzly v síti"
         
+        sampled = next(_transaction_sampler)
+        if sampled:
+            started = time.perf_counter()
+        
         # Náhodně vyber počáteční uzel
-        start_node = random.choice(list(self.nodes.values()))
+        if start_node is None:
+            start_node = random.choice(list(self.nodes.values()))
         
         # Zpracuj data
         result = start_node.process_data(data)
+        self.version += 1
         
         if result:
             # Propaguj sítí (simulace šíření vzruchu)
@@ -83,23 +137,47 @@ class NeuroNetwork:
             })
             
             # Aktualizuj počet vzorů
-            self.memory_patterns = len(self.transaction_history)
+            self.transaction_count += 1
+            self.memory_patterns = self.transaction_count
             
-            return f"✅ Transakce zpracována | Otisk: {result['vibration']['fingerprint'][:10]}"
+            message = f"✅ Transakce zpracována | Otisk: {result['vibration']['fingerprint'][:10]}"
         else:
-            return "⚠️  Nízký aktivační potenciál – transakce čeká"
+            message = "⚠️  Nízký aktivační potenciál – transakce čeká"
+        
+        if sampled:
+            TRANSACTION_SECONDS.observe(time.perf_counter() - started, metrics.SAMPLE_EVERY)
+        return message
+    
+    @synchronized
+    def process_transactions(self, items):
+        """Zpracuje dávku transakcí pod jedním zámkem, vrátí seznam výsledků
+        
+        Seznam uzlů se sestaví jednou pro celou dávku a během ní se nezmění –
+        transakce se nepřipíše uzlu, který mezitím síť opustil. Výsledky se
+        vrací až po dávce, aby zámek nedržel pomalý konzument.
+        """
+        node_list = list(self.nodes.values())
+        if not node_list:
+            return [self.process_transaction(data) for data in items]
+        return [self.process_transaction(data, random.choice(node_list)) for data in items]
     
     def _propagate_spike(self, spike, from_node_id):
         """Propaguje vzruch sítí (simulace šíření)"""
+        sampled = next(_spike_sampler)
+        if sampled:
+            started = time.perf_counter()
+        
         # Najdi všechny uzly s přímým spojením na zdroj
         propagated = set([from_node_id])
         to_process = [from_node_id]
+        examined = 0
         
         while to_process and len(propagated) < len(self.nodes):
             current = to_process.pop(0)
             
             if current in self.nodes:
                 node = self.nodes[current]
+                examined += len(node.synapses)
                 
                 # Projdi všechny synapse
                 for target_id, strength in node.synapses.items():
@@ -113,7 +191,15 @@ class NeuroNetwork:
                             target_node = self.nodes[target_id]
                             target_node.learn(current, True)
                             node.learn(target_id, True)
+        
+        if sampled:
+            # Vzorek 1 z N se zapisuje s vahou N – počty v histogramech odhadují celek
+            SPIKE_SECONDS.observe(time.perf_counter() - started, metrics.SAMPLE_EVERY)
+            SPIKE_NODES_REACHED.observe(len(propagated), metrics.SAMPLE_EVERY)
+            SPIKE_FANOUT.observe(examined, metrics.SAMPLE_EVERY)
     
+    @synchronized
+    @metrics.timed(CONSENSUS_SECONDS)
     def get_consensus(self, data):
         """Získá konsenzus sítě o datech"""
         if not self.nodes:
@@ -127,6 +213,8 @@ class NeuroNetwork:
             votes.append(probability > 0.5)
         
         agreement = sum(votes) / len(votes)
+        if metrics.ENABLED:
+            CONSENSUS_AGREEMENT.observe(agreement)
         
         if agreement >= self.consensus_threshold:
             return True  # Konsenzus dosažen
@@ -140,12 +228,16 @@ class NeuroNetwork:
             total += len(node.synapses)
         return total // 2  # Každá synapse se počítá dvakrát
     
+    @synchronized
     def get_network_state(self):
         """Vrátí stav celé sítě"""
         return {
             'nodes': len(self.nodes),
             'synapses': self.total_synapses(),
-            'transactions': len(self.transaction_history),
+            'transactions': self.transaction_count,
             'entanglement': self.entanglement_level,
             'memory_patterns': self.memory_patterns
         }
+
+# Globální instance (sdílená s webovým rozhraním)
+network = NeuroNetwork()
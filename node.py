@@ -17,6 +17,7 @@ class NeuroNode:
         self.node_id = node_id or f"node_{uuid.uuid4().hex[:8]}"
         self.created_at = datetime.now()
         self.synapses = {}  # Spojení na jiné uzly {node_id: strength}
+        self.synapse_delays = {}  # Zpoždění synapsí v ms {node_id: delay}
         self.memory = {}    # Lokální paměť (vibrační vzory)
         self.activation_potential = random.uniform(0.1, 1.0)
         self.learning_rate = 0.1
@@ -83,15 +84,19 @@ class NeuroNode:
                 # Oslabit spojení
                 self.synapses[from_node] = max(0.0, self.synapses[from_node] - self.learning_rate/2)
     
-    def add_synapse(self, other_node):
+    def add_synapse(self, other_node, delay=None):
         """Přidá spojení na jiný uzel"""
         strength = random.uniform(0.3, 0.7)  # Náhodná počáteční síla
         self.synapses[other_node] = strength
+        # Jen explicitní zpoždění (ms) – jinak si ho odvodí simulace v čase
+        if delay is not None:
+            self.synapse_delays[other_node] = delay
         
     def remove_synapse(self, other_node):
         """Odstraní spojení (zapomínání)"""
         if other_node in self.synapses:
             del self.synapses[other_node]
+            self.synapse_delays.pop(other_node, None)
     
     def get_state(self):
         """Vrátí aktuální stav uzlu"""
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Profilování za běhu (vzorkovací profiler a tracemalloc)
+"""
+
+import os
+import sys
+import time
+import threading
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+# Kam se ukládají výsledky (collapsed stacks pro flamegraph, alokace)
+PROFILE_DIR = os.environ.get('NEUROSTRING_PROFILE_DIR', 'profiles')
+DEFAULT_HZ = 100
+MAX_HZ = 1000       # horní mez vzorkování – bezpečné i pod zátěží
+MAX_SECONDS = 600
+
+def _collapse(frame, thread_name):
+    """Převede zásobník na řádek ve formátu collapsed stacks (kořen první)"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name}@{os.path.basename(code.co_filename)}:{code.co_firstlineno}")
+        frame = frame.f_back
+    names.append(thread_name.replace(' ', '_'))
+    return ';'.join(reversed(names))
+
+class SamplingProfiler:
+    """Vzorkovací profiler – v samostatném vlákně čte zásobníky všech vláken"""
+
+    def __init__(self, output_dir=PROFILE_DIR):
+        self.output_dir = output_dir
+        self.last_result = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds=10, hz=DEFAULT_HZ, trace_memory=True, memory_top=20):
+        """Spustí profilování na seconds sekund; vrátí False, pokud už běží"""
+        seconds = max(0.1, min(float(seconds), MAX_SECONDS))
+        hz = max(1, min(int(hz), MAX_HZ))
+
+        with self._lock:
+            if self.running:
+                return False
+            self._stop.clear()
+            # Výsledek předchozího běhu se nesmí vydávat za nový
+            self.last_result = None
+            self._thread = threading.Thread(
+                target=self._run, args=(seconds, hz, trace_memory, memory_top),
+                name='neurostring-profiler', daemon=True)
+            self._thread.start()
+        return True
+
+    def stop(self):
+        """Ukončí profilování předčasně a vrátí výsledek"""
+        self._stop.set()
+        return self.wait()
+
+    def wait(self, timeout=None):
+        """Počká na dokončení profilování a vrátí výsledek"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.last_result
+
+    def status(self):
+        result = self.last_result
+        return {'running': self.running, 'last_result': result,
+                'error': result.get('error') if result else None}
+
+    def _run(self, seconds, hz, trace_memory, memory_top):
+        started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            self.last_result = self._sample(seconds, hz, trace_memory, memory_top)
+        except Exception as e:
+            # Chyba (např. nezapisovatelný PROFILE_DIR) se hlásí ve výsledku
+            self.last_result = {'error': f"{type(e).__name__}: {e}"}
+        finally:
+            if started_tracing and tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+    def _sample(self, seconds, hz, trace_memory, memory_top):
+        """Vzorkuje zásobníky do vypršení času (nebo stop) a uloží výsledek"""
+        own_id = threading.get_ident()
+        stacks = Counter()
+        samples = 0
+        interval = 1.0 / hz
+        started = time.monotonic()
+        deadline = started + seconds
+
+        while not self._stop.is_set() and time.monotonic() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    stacks[_collapse(frame, names.get(thread_id, str(thread_id)))] += 1
+            samples += 1
+            self._stop.wait(interval)
+
+        allocations = []
+        if trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            for stat in snapshot.statistics('lineno')[:memory_top]:
+                frame = stat.traceback[0]
+                allocations.append({
+                    'location': f"{frame.filename}:{frame.lineno}",
+                    'size_kb': round(stat.size / 1024, 1),
+                    'count': stat.count
+                })
+
+        return self._write(stacks, allocations, {
+            'samples': samples,
+            'hz': hz,
+            'duration': round(time.monotonic() - started, 3)
+        })
+
+    def _write(self, stacks, allocations, summary):
+        """Uloží collapsed stacks (pro flamegraph.pl / speedscope) a top alokací"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        prefix = os.path.join(self.output_dir, f"neurostring-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+
+        stacks_path = prefix + '.folded'
+        with open(stacks_path, 'w') as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        summary['stacks_file'] = stacks_path
+        summary['allocations'] = allocations
+        if allocations:
+            alloc_path = prefix + '.alloc.txt'
+            with open(alloc_path, 'w') as f:
+                for item in allocations:
+                    f.write(f"{item['size_kb']:>10.1f} KiB {item['count']:>8} × {item['location']}\n")
+            summary['allocations_file'] = alloc_path
+
+        return summary
+
+# Globální instance
+profiler = SamplingProfiler()
@@ -5,104 +5,477 @@ NeuroString – Kvantové simulace (zjednodušené pro Replit)
 
 import random
 import math
+import itertools
 import numpy as np
 
+class QubitRegister:
+    """Registr qubitů uložený v polích NumPy (stav, superpozice, fáze)"""
+    
+    def __init__(self, capacity=64, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Skalární losování pro jednotlivé qubity – Generator stojí ~0.8 µs na číslo,
+        # random.Random desítky ns; semínko z rng drží reprodukovatelnost
+        self._scalar = random.Random(int(self.rng.integers(2**63)))
+        self.state = np.zeros(capacity, dtype=np.int8)
+        self.superposition = np.zeros(capacity, dtype=bool)
+        self.phase = np.zeros(capacity, dtype=np.float64)
+        self._index = {}               # {qubit_id: slot}
+        self._ids = [None] * capacity  # slot -> qubit_id
+        self._free = []                # uvolněné sloty k opětovnému použití
+        self._used = 0                 # nejvyšší dosud použitý slot
+    
+    def __len__(self):
+        return len(self._index)
+    
+    def __contains__(self, qubit_id):
+        return qubit_id in self._index
+    
+    def __getitem__(self, qubit_id):
+        slot = self._index[qubit_id]
+        return {
+            'state': self.state.item(slot),
+            'superposition': self.superposition.item(slot),
+            'phase': self.phase.item(slot)
+        }
+    
+    def get(self, qubit_id, default=None):
+        """Vrátí stav qubitu jako slovník, nebo default"""
+        if qubit_id not in self._index:
+            return default
+        return self[qubit_id]
+    
+    def ids(self):
+        """Vrátí ID všech živých qubitů"""
+        return list(self._index)
+    
+    def slots(self, qubit_ids):
+        """Převede ID qubitů na indexy do polí (O(1) na qubit)"""
+        index = self._index
+        return np.fromiter((index[q] for q in qubit_ids), dtype=np.intp, count=len(qubit_ids))
+    
+    def _grow(self, needed):
+        """Zvětší pole (zdvojnásobením) tak, aby pojala needed slotů"""
+        capacity = len(self._ids)
+        if needed <= capacity:
+            return
+        
+        while capacity < needed:
+            capacity *= 2
+        
+        for name in ('state', 'superposition', 'phase'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self._ids.extend([None] * (capacity - len(self._ids)))
+    
+    def _allocate(self, qubit_ids):
+        """Přidělí sloty – existující qubity si ponechají svůj slot"""
+        new_ids = [q for q in dict.fromkeys(qubit_ids) if q not in self._index]
+        reused = min(len(new_ids), len(self._free))
+        self._grow(self._used + len(new_ids) - reused)
+        
+        for qubit_id in new_ids:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = self._used
+                self._used += 1
+            self._index[qubit_id] = slot
+            self._ids[slot] = qubit_id
+        
+        return self.slots(qubit_ids)
+    
+    def _allocate_one(self, qubit_id):
+        """Přidělí slot jednomu qubitu (existující si ponechá svůj)"""
+        slot = self._index.get(qubit_id)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = self._used
+                self._grow(slot + 1)
+                self._used += 1
+            self._index[qubit_id] = slot
+            self._ids[slot] = qubit_id
+        return slot
+    
+    def create(self, qubit_id, state=None):
+        """Vytvoří (nebo znovu inicializuje) jeden qubit – skalárně, bez dávkových polí"""
+        slot = self._allocate_one(qubit_id)
+        draw = self._scalar.random
+        state = int(draw() < 0.5) if state is None else int(state)
+        superposition = draw() > 0.7  # 30% v superpozici
+        phase = draw() * 2 * math.pi
+        
+        self.state[slot] = state
+        self.superposition[slot] = superposition
+        self.phase[slot] = phase
+        return {'state': state, 'superposition': superposition, 'phase': phase}
+    
+    def create_many(self, qubit_ids, states=None):
+        """Vytvoří více qubitů najednou – jedno losování pro celou dávku"""
+        qubit_ids = list(qubit_ids)
+        slots = self._allocate(qubit_ids)
+        draws = self.rng.random((3, len(slots)))
+        
+        if states is None:
+            self.state[slots] = draws[0] < 0.5
+        else:
+            self.state[slots] = np.asarray(states, dtype=np.int8)
+        self.superposition[slots] = draws[1] > 0.7  # 30% v superpozici
+        self.phase[slots] = draws[2] * 2 * math.pi
+        
+        return slots
+    
+    def set_state(self, qubit_ids, state):
+        """Nastaví stav vybraným qubitům"""
+        self.state[self.slots(qubit_ids)] = state
+    
+    def _collapse(self, slots):
+        """Kolabuje qubity v superpozici – jedno losování pro všechny"""
+        outcomes = self.rng.integers(0, 2, size=len(slots), dtype=np.int8)
+        superposed = self.superposition[slots]
+        self.state[slots] = np.where(superposed, outcomes, self.state[slots])
+        self.superposition[slots] = False
+        return self.state[slots]
+    
+    def measure(self, qubit_id):
+        """Změří jeden qubit (skalárně), vrátí stav nebo None pro neznámý qubit"""
+        slot = self._index.get(qubit_id)
+        if slot is None:
+            return None
+        if self.superposition.item(slot):
+            state = self._scalar.getrandbits(1)
+            self.state[slot] = state
+            self.superposition[slot] = False
+            return state
+        return self.state.item(slot)
+    
+    def measure_many(self, qubit_ids):
+        """Změří více qubitů najednou, vrátí pole stavů"""
+        return self._collapse(self.slots(qubit_ids))
+    
+    def measure_all(self):
+        """Změří celý registr, vrátí (ID, pole stavů)"""
+        qubit_ids = self.ids()
+        slots = np.fromiter(self._index.values(), dtype=np.intp, count=len(qubit_ids))
+        return qubit_ids, self._collapse(slots)
+    
+    def release(self, qubit_id):
+        """Uvolní qubit a vrátí jeho slot k dalšímu použití"""
+        slot = self._index.pop(qubit_id, None)
+        if slot is None:
+            return False
+        
+        self._ids[slot] = None
+        self.state[slot] = 0
+        self.superposition[slot] = False
+        self.phase[slot] = 0.0
+        self._free.append(slot)
+        return True
+    
+    def release_many(self, qubit_ids):
+        """Uvolní více qubitů, vrátí počet skutečně uvolněných"""
+        return sum(1 for qubit_id in qubit_ids if self.release(qubit_id))
+
 class QuantumSimulator:
     """Třída pro simulaci kvantových jevů v NeuroStringu"""
     
-    def __init__(self):
-        self.qubits = {}
-        self.entangled_pairs = []
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.qubits = QubitRegister(rng=self.rng)
+        # Provázání jako disjunktní množiny (union-find)
+        self._parent = {}   # {qubit_id: rodič ve stromu skupiny}
+        self._members = {}  # {kořen: [qubit_id, ...]}
+        self.version = 0    # Čítač změn skupin provázání
         
     def create_qubit(self, qubit_id, state=None):
         """Vytvoří nový qubit"""
-        if state is None:
-            # Náhodný stav |0> nebo |1> s pravděpodobností
-            state = random.choice([0, 1])
-        
-        self.qubits[qubit_id] = {
-            'state': state,
-            'superposition': random.uniform(0, 1) > 0.7,  # 30% v superpozici
-            'phase': random.uniform(0, 2*math.pi)
-        }
-        return self.qubits[qubit_id]
+        return self.qubits.create(qubit_id, state)
+    
+    def create_qubits(self, qubit_ids, states=None):
+        """Vytvoří více qubitů najednou"""
+        self.qubits.create_many(qubit_ids, states)
+    
+    def _find(self, qubit_id):
+        """Najde kořen skupiny provázání (s kompresí cesty)"""
+        parent = self._parent
+        root = qubit_id
+        while parent[root] != root:
+            root = parent[root]
+        
+        # Komprese cesty – všechny uzly na cestě ukážou přímo na kořen
+        while parent[qubit_id] != root:
+            parent[qubit_id], qubit_id = root, parent[qubit_id]
+        
+        return root
+    
+    def _union(self, qubit1_id, qubit2_id):
+        """Spojí skupiny dvou qubitů, menší se připojí k větší"""
+        for qubit_id in (qubit1_id, qubit2_id):
+            if qubit_id not in self._parent:
+                self._parent[qubit_id] = qubit_id
+                self._members[qubit_id] = [qubit_id]
+        
+        root1 = self._find(qubit1_id)
+        root2 = self._find(qubit2_id)
+        if root1 == root2:
+            return root1
+        self.version += 1
+        
+        if len(self._members[root1]) < len(self._members[root2]):
+            root1, root2 = root2, root1
+        
+        self._parent[root2] = root1
+        self._members[root1].extend(self._members.pop(root2))
+        return root1
     
     def entangle(self, qubit1_id, qubit2_id):
         """Prováže dva qubity (Bell state)"""
         if qubit1_id in self.qubits and qubit2_id in self.qubits:
             # Simulace kvantového provázání
-            self.entangled_pairs.append((qubit1_id, qubit2_id))
+            self._union(qubit1_id, qubit2_id)
             
             # Nastav stejný stav pro oba
-            state = random.choice([0, 1])
-            self.qubits[qubit1_id]['state'] = state
-            self.qubits[qubit2_id]['state'] = state
+            state = int(self.rng.integers(0, 2))
+            self.qubits.set_state([qubit1_id, qubit2_id], state)
             
             return True
         return False
     
+    def entangled_with(self, qubit_id):
+        """Vrátí všechny qubity ve stejné skupině provázání"""
+        if qubit_id not in self._parent:
+            return [qubit_id] if qubit_id in self.qubits else []
+        return list(self._members[self._find(qubit_id)])
+    
     def measure(self, qubit_id):
         """Změří qubit (kolabuje vlnovou funkci)"""
-        if qubit_id not in self.qubits:
-            return None
+        # Pokud je v superpozici, kolabuje náhodně (neznámý qubit → None)
+        state = self.qubits.measure(qubit_id)
+        
+        # Pokud je provázaný, kolabuje celá skupina (i tranzitivně)
+        if state is not None and qubit_id in self._parent:
+            self._collapse_group(self._find(qubit_id), state)
+        
+        return state
+    
+    def measure_many(self, qubit_ids):
+        """Změří více qubitů najednou, vrátí pole stavů"""
+        qubit_ids = list(qubit_ids)
+        states = self.qubits.measure_many(qubit_ids)
+        self._propagate_groups(qubit_ids, states)
+        return states
+    
+    def measure_all(self):
+        """Změří všechny qubity, vrátí (ID, pole stavů)"""
+        qubit_ids, states = self.qubits.measure_all()
+        self._propagate_groups(qubit_ids, states)
+        return qubit_ids, states
+    
+    def _collapse_group(self, root, state):
+        """Nastaví změřený stav celé skupině provázání"""
+        slots = self.qubits.slots(self._members[root])
+        self.qubits.state[slots] = state
+        self.qubits.superposition[slots] = False
+    
+    def _propagate_groups(self, qubit_ids, states):
+        """Rozšíří výsledky měření na skupiny – první změřený člen rozhoduje"""
+        if not self._parent:
+            return
+        
+        collapsed = {}
+        for i, qubit_id in enumerate(qubit_ids):
+            if qubit_id not in self._parent:
+                continue
+            root = self._find(qubit_id)
+            if root in collapsed:
+                states[i] = collapsed[root]
+            else:
+                collapsed[root] = states[i]
+                self._collapse_group(root, states[i])
+    
+    def release_qubit(self, qubit_id):
+        """Uvolní qubit z registru i ze skupiny provázání"""
+        if qubit_id in self._parent:
+            members = self._members.pop(self._find(qubit_id))
+            members.remove(qubit_id)
+            del self._parent[qubit_id]
+            self.version += 1
+            
+            # Přestav zbytek skupiny pod nový kořen (osamocený qubit není provázaný)
+            if len(members) > 1:
+                root = members[0]
+                for member_id in members:
+                    self._parent[member_id] = root
+                self._members[root] = members
+            else:
+                for member_id in members:
+                    del self._parent[member_id]
+        
+        return self.qubits.release(qubit_id)
+    
+    def collect(self, live_ids):
+        """Uvolní všechny qubity, které nepatří živým uzlům (garbage collection)"""
+        live_ids = set(live_ids)
+        dead = [qubit_id for qubit_id in self.qubits.ids() if qubit_id not in live_ids]
+        for qubit_id in dead:
+            self.release_qubit(qubit_id)
+        return len(dead)
+    
+    def entanglement_stats(self):
+        """Vrátí statistiky skupin provázání (pro dashboard)"""
+        sizes = {}
+        largest = 0
+        for members in self._members.values():
+            size = len(members)
+            sizes[size] = sizes.get(size, 0) + 1
+            largest = max(largest, size)
         
-        qubit = self.qubits[qubit_id]
+        return {
+            'groups': len(self._members),
+            'entangled_qubits': len(self._parent),
+            'largest_group': largest,
+            'size_distribution': {str(size): count for size, count in sorted(sizes.items())}
+        }
+    
+    def quantum_fourier_transform(self, data, mode='simple'):
+        """Simulace kvantové Fourierovy transformace
         
-        # Pokud je v superpozici, kolabuje náhodně
-        if qubit['superposition']:
-            qubit['state'] = random.choice([0, 1])
-            qubit['superposition'] = False
+        mode='simple' vrací amplitudy jako dřív (seznam |val|),
+        mode='dft' vrací skutečné diskrétní Fourierovo spektrum (numpy.fft).
+        """
+        if mode not in ('simple', 'dft'):
+            raise ValueError(f"Neznámý režim QFT: {mode!r} (povolené: 'simple', 'dft')")
+        signal = _as_signal(data)
         
-        # Pokud je provázaný, ovlivní partnera
-        for q1, q2 in self.entangled_pairs:
-            if q1 == qubit_id and q2 in self.qubits:
-                self.qubits[q2]['state'] = qubit['state']
-            elif q2 == qubit_id and q1 in self.qubits:
-                self.qubits[q1]['state'] = qubit['state']
+        if mode == 'dft':
+            return np.fft.fft(signal)
         
-        return qubit['state']
+        # Zjednodušená simulace – |val * e^(2πi·k/n)| = |val|
+        return np.abs(signal).astype(float).tolist()
     
-    def quantum_fourier_transform(self, data):
-        """Simulace kvantové Fourierovy transformace"""
-        # Zjednodušená simulace – převod na frekvence
-        if isinstance(data, str):
-            data = [ord(c) for c in data]
-        elif isinstance(data, (int, float)):
-            data = [data]
+    def quantum_fourier_transform_batch(self, payloads, length=None, onesided=False):
+        """Fourierova transformace mnoha payloadů jedním 2D voláním FFT
+        
+        Kratší payloady se doplní nulami na délku nejdelšího (nebo length).
+        onesided=True použije rfft – pro reálné vstupy poloviční práce
+        (komplexní vstup s onesided=True vyhodí ValueError).
+        """
+        signals = [_as_signal(p) for p in payloads]
+        if length is None:
+            length = max((len(sig) for sig in signals), default=0)
         
-        # Aplikuj "kvantovou" transformaci
-        frequencies = []
-        for i, val in enumerate(data):
-            freq = val * math.exp(2j * math.pi * i / len(data))
-            frequencies.append(abs(freq))
+        if length == 0:
+            return np.zeros((len(signals), 0), dtype=np.complex128)
         
-        return frequencies
+        dtype = np.result_type(*[sig.dtype for sig in signals])
+        if onesided and np.issubdtype(dtype, np.complexfloating):
+            raise ValueError("onesided=True (rfft) vyžaduje reálné vstupy – pro komplexní použijte onesided=False")
+        batch = np.zeros((len(signals), length), dtype=dtype)
+        for row, sig in zip(batch, signals):
+            n = min(len(sig), length)
+            row[:n] = sig[:n]
+        
+        if onesided:
+            return np.fft.rfft(batch, axis=1)
+        return np.fft.fft(batch, axis=1)
     
     def quantum_random(self):
         """Generuje skutečně náhodné číslo pomocí kvantových principů"""
         # Simulace kvantové náhodnosti
         return (random.random() + random.random()) / 2
+    
+    def quantum_random_many(self, count):
+        """Vygeneruje count kvantových náhodných čísel jedním voláním RNG"""
+        return self.rng.random((2, count)).mean(axis=0)
+
+def _as_signal(data):
+    """Převede data na 1D pole NumPy bez smyčky v Pythonu"""
+    if isinstance(data, str):
+        # UTF-32 dává přímo kódové body (totéž co ord() pro každý znak)
+        return np.frombuffer(data.encode('utf-32-le'), dtype='<u4')
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return np.frombuffer(data, dtype=np.uint8)
+    if isinstance(data, (int, float, complex)):
+        return np.array([data])
+    return np.asarray(data).ravel()
 
 # Globální instance pro snadné použití
 quantum = QuantumSimulator()
 
 def get_quantum_state(node_id):
     """Získá kvantový stav uzlu"""
-    qubit = quantum.create_qubit(node_id)
+    qubit = quantum.qubits.get(node_id) or quantum.create_qubit(node_id)
     return {
         'state': qubit['state'],
         'superposition': qubit['superposition'],
         'phase': qubit['phase']
     }
 
-def quantum_consensus(votes):
-    """Kvantový konsenzus – vážené hlasování s provázáním"""
-    if not votes:
-        return 0
+class ConsensusAccumulator:
+    """Průběžný kvantový konsenzus – hlasy po dávkách, dílčí výsledky lze slučovat"""
+    
+    def __init__(self, simulator=None):
+        self.simulator = simulator or quantum
+        self.weighted_sum = 0.0
+        self.total_weight = 0.0
+        self.count = 0
+    
+    def add(self, votes):
+        """Přidá dávku hlasů (seznam nebo pole NumPy)"""
+        votes = np.asarray(votes, dtype=np.float64).ravel()
+        if votes.size:
+            weights = self.simulator.quantum_random_many(votes.size)
+            self.weighted_sum += float(votes @ weights)
+            self.total_weight += float(weights.sum())
+            self.count += votes.size
+        return self
+    
+    def add_stream(self, votes, chunk_size=65536):
+        """Přidá hlasy z libovolného iterátoru po dávkách (omezená paměť)"""
+        votes = iter(votes)
+        while True:
+            chunk = np.fromiter(itertools.islice(votes, chunk_size), dtype=np.float64)
+            if not chunk.size:
+                break
+            self.add(chunk)
+        return self
+    
+    def partial(self):
+        """Dílčí výsledek jako n-tice (lze poslat mezi procesy)"""
+        return (self.weighted_sum, self.total_weight, self.count)
+    
+    def merge(self, other):
+        """Sloučí výsledek jiného akumulátoru (nebo jeho partial())"""
+        if isinstance(other, ConsensusAccumulator):
+            other = other.partial()
+        weighted_sum, total_weight, count = other
+        self.weighted_sum += weighted_sum
+        self.total_weight += total_weight
+        self.count += count
+        return self
+    
+    def result(self):
+        """Vrátí vážený konsenzus všech dosud přidaných hlasů"""
+        return self.weighted_sum / self.total_weight if self.total_weight > 0 else 0
+
+def quantum_consensus(votes, simulator=None, chunk_size=65536):
+    """Kvantový konsenzus – vážené hlasování s provázáním
+    
+    votes může být seznam, pole NumPy nebo generátor. simulator může být
+    libovolný objekt s metodou quantum_random_many() (např. StatevectorSimulator),
+    výchozí je globální QuantumSimulator.
+    """
+    accumulator = ConsensusAccumulator(simulator)
+    
+    if not isinstance(votes, (list, tuple, np.ndarray)):
+        return accumulator.add_stream(votes, chunk_size).result()
     
-    # Simulace kvantového vážení
-    weights = [quantum.quantum_random() for _ in votes]
-    weighted_sum = sum(v * w for v, w in zip(votes, weights))
-    total_weight = sum(weights)
+    # Simulace kvantového vážení – všechny váhy jedním voláním RNG (po dávkách)
+    votes = np.asarray(votes, dtype=np.float64).ravel()
+    for start in range(0, votes.size, chunk_size):
+        accumulator.add(votes[start:start + chunk_size])
     
-    return weighted_sum / total_weight if total_weight > 0 else 0
+    return accumulator.result()
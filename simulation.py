@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Simulace v čase (diskrétní události, krokovaný leaky integrate-and-fire)
+"""
+
+import math
+import zlib
+import heapq
+import itertools
+import numpy as np
+
+DELAY_RANGE = (1.0, 5.0)  # rozsah odvozených zpoždění synapsí (ms)
+
+def edge_delay(source_id, target_id, low=DELAY_RANGE[0], high=DELAY_RANGE[1]):
+    """Deterministické zpoždění synapse z hashe hrany (bez vlivu na random)"""
+    h = zlib.crc32(f"{source_id}->{target_id}".encode())
+    return low + (high - low) * (h / 0xFFFFFFFF)
+
+class EventScheduler:
+    """Událostmi řízená simulace sítě – prioritní fronta vzruchů s časem (ms)
+
+    Každý vnější podnět spustí vlnu; stejně jako v NeuroNetwork._propagate_spike
+    vyšle uzel v rámci jedné vlny vzruch nejvýše jednou. Aktivace vyhasíná
+    exponenciálně s časovou konstantou tau a útlum se počítá líně, až když uzel
+    zasáhne další vzruch – cena simulace roste s počtem událostí, ne uzlů × kroků.
+    """
+
+    def __init__(self, network, tau=20.0, threshold=0.8, reset=0.1,
+                 default_delay=None, gain=1.0, learn=True):
+        self.network = network
+        self.tau = tau                      # časová konstanta útlumu (ms)
+        self.threshold = threshold          # práh pro vyslání vzruchu
+        self.reset = reset                  # aktivace po vyslání vzruchu
+        self.default_delay = default_delay  # zpoždění synapsí bez vlastní hodnoty (None = edge_delay)
+        self.gain = gain
+        self.learn = learn
+
+        self.now = 0.0
+        self.events_processed = 0
+        self.spikes_fired = 0
+        self._queue = []                    # halda (čas, pořadí, cíl, zdroj, síla, vlna)
+        self._sequence = itertools.count()  # stabilní pořadí událostí se stejným časem
+        self._waves = itertools.count()
+        self._wave_fired = {}               # {vlna: uzly, které už vzruch vyslaly}
+        self._wave_pending = {}             # {vlna: počet nedoručených událostí}
+        self._last_update = {}              # {node_id: čas posledního útlumu}
+        self._edge_delays = {}              # {(zdroj, cíl): odvozené zpoždění}
+
+    @property
+    def pending(self):
+        """Počet naplánovaných (nezpracovaných) událostí"""
+        return len(self._queue)
+
+    @property
+    def active_waves(self):
+        return len(self._wave_pending)
+
+    def next_time(self):
+        """Čas nejbližší události, nebo None"""
+        return self._queue[0][0] if self._queue else None
+
+    def _schedule(self, time, target_id, strength, source_id, wave):
+        heapq.heappush(self._queue, (time, next(self._sequence), target_id, source_id, strength, wave))
+        self._wave_pending[wave] += 1
+
+    def inject(self, node_id, strength=1.0, delay=0.0):
+        """Vnější podnět (např. transakce) do uzlu – začne novou vlnu, vrátí její ID"""
+        wave = next(self._waves)
+        self._wave_fired[wave] = set()
+        self._wave_pending[wave] = 0
+        self._schedule(self.now + delay, node_id, strength, None, wave)
+        return wave
+
+    def _decay(self, node, time):
+        """Líný útlum aktivace od posledního dotyku uzlu"""
+        last = self._last_update.get(node.node_id, 0.0)
+        if time > last:
+            node.activation_potential *= math.exp((last - time) / self.tau)
+        self._last_update[node.node_id] = time
+
+    def _delay(self, node, target_id):
+        """Zpoždění synapse – explicitní, pevné default_delay, nebo odvozené z hrany"""
+        delay = node.synapse_delays.get(target_id)
+        if delay is not None:
+            return delay
+        if self.default_delay is not None:
+            return self.default_delay
+        key = (node.node_id, target_id)
+        delay = self._edge_delays.get(key)
+        if delay is None:
+            delay = self._edge_delays[key] = edge_delay(*key)
+        return delay
+
+    def _fire(self, node, source_id, wave):
+        """Uzel vyšle vzruch – naplánuje doručení přes synapse s vlastním zpožděním"""
+        node.activation_potential = self.reset
+        node.spike_count += 1
+        self.spikes_fired += 1
+        fired = self._wave_fired[wave]
+        fired.add(node.node_id)
+
+        # Hebbovské učení – úspěšný přenos posílí spojení
+        if self.learn and source_id in node.synapses and source_id in self.network.nodes:
+            node.learn(source_id, True)
+            self.network.nodes[source_id].learn(node.node_id, True)
+
+        for target_id, weight in node.synapses.items():
+            if target_id not in fired:
+                self._schedule(self.now + self._delay(node, target_id),
+                               target_id, weight, node.node_id, wave)
+
+    def step(self):
+        """Zpracuje jednu událost; vrátí (čas, cíl, zdroj, síla) nebo None"""
+        if not self._queue:
+            return None
+
+        time, _, target_id, source_id, strength, wave = heapq.heappop(self._queue)
+        self.now = time
+        self.events_processed += 1
+
+        node = self.network.nodes.get(target_id)
+        # Uzel mezitím opustil síť nebo už v této vlně vzruch vyslal – událost propadá
+        if node is not None and target_id not in self._wave_fired[wave]:
+            self._decay(node, time)
+            node.activation_potential += strength * self.gain
+            if node.activation_potential > self.threshold:
+                self._fire(node, source_id, wave)
+
+        self._wave_pending[wave] -= 1
+        if not self._wave_pending[wave]:
+            del self._wave_pending[wave]
+            del self._wave_fired[wave]
+
+        return time, target_id, source_id, strength
+
+    def run_until(self, time, max_events=None):
+        """Zpracuje všechny události do času time (včetně); vrátí jejich počet"""
+        processed = 0
+        with self.network.lock:
+            while self._queue and self._queue[0][0] <= time:
+                if max_events is not None and processed >= max_events:
+                    break
+                self.step()
+                processed += 1
+
+            if not self._queue or self._queue[0][0] > time:
+                self.now = max(self.now, time)
+            if processed:
+                self.network.version += 1
+
+        return processed
+
+    def stats(self):
+        return {
+            'time': self.now,
+            'events': self.events_processed,
+            'spikes': self.spikes_fired,
+            'pending': self.pending,
+            'active_waves': self.active_waves
+        }
+
+
+class LIFEngine:
+    """Časově krokovaná simulace (leaky integrate-and-fire) nad poli celé sítě
+
+    Synapse jsou v řídké matici CSR (indptr, indices, weights) po řádcích
+    zdrojových uzlů. Jeden krok = součin vektoru vzruchů s maticí vah,
+    útlum, práh a reset – pár operací NumPy pro všechny uzly najednou.
+    """
+
+    def __init__(self, indptr, indices, weights, activation=None, node_ids=None,
+                 tau=20.0, dt=1.0, threshold=0.8, reset=0.1):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.size = len(self.indptr) - 1
+        self.node_ids = node_ids
+        self.decay = np.float32(math.exp(-dt / tau))
+        self.threshold = threshold
+        self.reset = reset
+
+        if activation is None:
+            activation = np.full(self.size, reset, dtype=np.float32)
+        self.activation = np.asarray(activation, dtype=np.float32).copy()
+        self.spikes = np.zeros(self.size, dtype=bool)
+        self.spike_count = np.zeros(self.size, dtype=np.int64)
+        self.tick = 0
+        self._edge_sources = None  # zdrojový uzel každé hrany (jen pro hustou aktivitu)
+
+    @classmethod
+    def from_network(cls, network, **kwargs):
+        """Sestaví pole z NeuroNetwork (uzly a jejich synapse)"""
+        node_ids = list(network.nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        indptr = [0]
+        indices = []
+        weights = []
+        for node in network.nodes.values():
+            for target_id, strength in node.synapses.items():
+                if target_id in index:
+                    indices.append(index[target_id])
+                    weights.append(strength)
+            indptr.append(len(indices))
+
+        activation = [node.activation_potential for node in network.nodes.values()]
+        return cls(indptr, indices, weights, activation=activation, node_ids=node_ids, **kwargs)
+
+    @classmethod
+    def random(cls, size, degree=8, seed=None, **kwargs):
+        """Náhodná síť přímo v polích (pro velké sítě bez objektů NeuroNode)"""
+        rng = np.random.default_rng(seed)
+        indptr = np.arange(0, size * degree + 1, degree, dtype=np.int64)
+        indices = rng.integers(0, size, size * degree, dtype=np.int32)
+        weights = rng.uniform(0.3, 0.7, size * degree).astype(np.float32)
+        activation = rng.uniform(0.1, 1.0, size).astype(np.float32)
+        return cls(indptr, indices, weights, activation=activation, **kwargs)
+
+    def _synaptic_input(self):
+        """Řídký součin vzruchy × váhy – jen přes synapse uzlů, které vystřelily"""
+        rows = np.flatnonzero(self.spikes)
+        if not rows.size:
+            return None
+
+        starts = self.indptr[rows]
+        counts = self.indptr[rows + 1] - starts
+        active = int(counts.sum())
+
+        if active > self.weights.size // 2:
+            # Většina sítě je aktivní – levnější je projít všechny hrany najednou
+            if self._edge_sources is None:
+                self._edge_sources = np.repeat(np.arange(self.size, dtype=np.int32), np.diff(self.indptr))
+            weights = np.where(self.spikes[self._edge_sources], self.weights, np.float32(0))
+            return np.bincount(self.indices, weights=weights, minlength=self.size).astype(np.float32)
+
+        # Indexy hran všech aktivních řádků bez smyčky v Pythonu
+        edges = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(active)
+        return np.bincount(self.indices[edges], weights=self.weights[edges],
+                           minlength=self.size).astype(np.float32)
+
+    def step(self, external=None):
+        """Jeden krok: vstup ze synapsí, útlum, práh, reset; vrátí počet vzruchů"""
+        synaptic = self._synaptic_input()
+
+        self.activation *= self.decay
+        if synaptic is not None:
+            self.activation += synaptic
+        if external is not None:
+            self.activation += external
+
+        np.greater(self.activation, self.threshold, out=self.spikes)
+        self.activation[self.spikes] = self.reset
+        self.spike_count += self.spikes
+        self.tick += 1
+        return int(np.count_nonzero(self.spikes))
+
+    def run(self, ticks, external=None):
+        """Provede ticks kroků; vrátí celkový počet vzruchů"""
+        return sum(self.step(external) for _ in range(ticks))
+
+    def write_back(self, network):
+        """Zapíše aktivace a počty vzruchů zpět do uzlů sítě"""
+        if self.node_ids is None:
+            raise ValueError("Engine nevznikl ze sítě (from_network)")
+
+        with network.lock:
+            for i, node_id in enumerate(self.node_ids):
+                node = network.nodes.get(node_id)
+                if node is not None:
+                    node.activation_potential = float(self.activation[i])
+                    node.spike_count += int(self.spike_count[i])
+            self.spike_count[:] = 0
+            network.version += 1
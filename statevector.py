@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+NeuroString – Statevector simulace (skutečné amplitudy pro malé registry)
+"""
+
+import math
+import numpy as np
+
+# Základní jednoqubitové brány
+SQRT1_2 = 1 / math.sqrt(2)
+GATES = {
+    'I': np.array([[1, 0], [0, 1]], dtype=np.complex128),
+    'X': np.array([[0, 1], [1, 0]], dtype=np.complex128),
+    'Y': np.array([[0, -1j], [1j, 0]], dtype=np.complex128),
+    'Z': np.array([[1, 0], [0, -1]], dtype=np.complex128),
+    'H': np.array([[SQRT1_2, SQRT1_2], [SQRT1_2, -SQRT1_2]], dtype=np.complex128),
+    'S': np.array([[1, 0], [0, 1j]], dtype=np.complex128),
+    'T': np.array([[1, 0], [0, np.exp(1j * math.pi / 4)]], dtype=np.complex128),
+}
+
+# Dvouqubitová brána SWAP (pořadí bází |q1 q2>)
+SWAP = np.array([[1, 0, 0, 0],
+                 [0, 0, 1, 0],
+                 [0, 1, 0, 0],
+                 [0, 0, 0, 1]], dtype=np.complex128)
+
+
+def rx(theta):
+    """Rotace kolem osy X"""
+    c, s = math.cos(theta / 2), math.sin(theta / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]], dtype=np.complex128)
+
+
+def rz(theta):
+    """Rotace kolem osy Z"""
+    return np.array([[np.exp(-0.5j * theta), 0], [0, np.exp(0.5j * theta)]], dtype=np.complex128)
+
+
+def _apply_1q(tensor, axis, gate):
+    """Aplikuje bránu 2x2 na osu tenzoru – na místě, přes pohledy"""
+    # Řezy (ne celočíselné indexy): u 1-D tenzoru by index vrátil skalár místo pohledu
+    index0 = [slice(None)] * tensor.ndim
+    index1 = list(index0)
+    index0[axis] = slice(0, 1)
+    index1[axis] = slice(1, 2)
+    a0 = tensor[tuple(index0)]
+    a1 = tensor[tuple(index1)]
+
+    # Jediná pomocná kopie poloviny amplitud
+    old0 = a0.copy()
+    a0 *= gate[0, 0]
+    a0 += gate[0, 1] * a1
+    a1 *= gate[1, 1]
+    a1 += gate[1, 0] * old0
+
+
+class StatevectorSimulator:
+    """Statevector simulátor s amplitudami v jednom souvislém poli"""
+
+    max_qubits = 24
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.amplitudes = np.ones(1, dtype=np.complex128)
+        self.qubits = {}  # {qubit_id: osa v tenzoru}
+        self.entangled_pairs = set()
+
+    @property
+    def num_qubits(self):
+        return len(self.qubits)
+
+    def _tensor(self):
+        """Pohled na amplitudy jako tenzor (2, 2, ..., 2) – bez kopie"""
+        return self.amplitudes.reshape((2,) * self.num_qubits)
+
+    def _axis(self, qubit_id):
+        if qubit_id not in self.qubits:
+            raise KeyError(f"Neznámý qubit: {qubit_id}")
+        return self.qubits[qubit_id]
+
+    def create_qubit(self, qubit_id, state=None):
+        """Přidá qubit do registru jako novou (poslední) osu"""
+        if qubit_id in self.qubits:
+            return self.get_qubit_state(qubit_id)
+        if self.num_qubits >= self.max_qubits:
+            raise ValueError(f"Statevector je omezen na {self.max_qubits} qubitů")
+
+        superposition = False
+        if state is None:
+            # Stejné rozdělení jako QuantumSimulator: náhodný stav, 30% v superpozici
+            state = int(self.rng.integers(0, 2))
+            superposition = self.rng.random() > 0.7
+
+        # Tenzorový součin |psi> ⊗ |state> – nová osa je nejméně významná
+        amplitudes = np.zeros((self.amplitudes.size, 2), dtype=np.complex128)
+        amplitudes[:, state] = self.amplitudes
+        self.amplitudes = amplitudes.reshape(-1)
+        self.qubits[qubit_id] = self.num_qubits
+
+        if superposition:
+            self.apply_gate('H', qubit_id)
+
+        return self.get_qubit_state(qubit_id)
+
+    def apply_gate(self, gate, qubit_id):
+        """Aplikuje jednoqubitovou bránu (název z GATES nebo matice 2x2)"""
+        gate = GATES[gate] if isinstance(gate, str) else np.asarray(gate, dtype=np.complex128)
+        _apply_1q(self._tensor(), self._axis(qubit_id), gate)
+
+    def apply_controlled(self, gate, control_id, target_id):
+        """Aplikuje bránu na cílový qubit jen v podprostoru control = |1>"""
+        gate = GATES[gate] if isinstance(gate, str) else np.asarray(gate, dtype=np.complex128)
+        control = self._axis(control_id)
+        target = self._axis(target_id)
+        if control == target:
+            raise ValueError("Řídicí a cílový qubit musí být různé")
+
+        # Řez control = 1 je pohled; osa cíle se posune, pokud leží za řídicí
+        subspace = self._tensor()[(slice(None),) * control + (1,)]
+        _apply_1q(subspace, target - 1 if target > control else target, gate)
+
+    def cnot(self, control_id, target_id):
+        self.apply_controlled('X', control_id, target_id)
+
+    def cz(self, control_id, target_id):
+        self.apply_controlled('Z', control_id, target_id)
+
+    def apply_two_qubit_gate(self, gate, qubit1_id, qubit2_id):
+        """Aplikuje obecnou bránu 4x4 na dvojici qubitů"""
+        gate = np.asarray(gate, dtype=np.complex128).reshape(2, 2, 2, 2)
+        axis1 = self._axis(qubit1_id)
+        axis2 = self._axis(qubit2_id)
+        if axis1 == axis2:
+            raise ValueError("Qubity musí být různé")
+
+        tensor = self._tensor()
+        # Kontrakce jen přes dvě dotčené osy, výsledek se zapíše zpět do stejného pole
+        result = np.tensordot(gate, tensor, axes=([2, 3], [axis1, axis2]))
+        tensor[...] = np.moveaxis(result, [0, 1], [axis1, axis2])
+
+    def swap(self, qubit1_id, qubit2_id):
+        self.apply_two_qubit_gate(SWAP, qubit1_id, qubit2_id)
+
+    def entangle(self, qubit1_id, qubit2_id):
+        """Prováže dva qubity (Bell state: H + CNOT)"""
+        if qubit1_id in self.qubits and qubit2_id in self.qubits and qubit1_id != qubit2_id:
+            self.apply_gate('H', qubit1_id)
+            self.cnot(qubit1_id, qubit2_id)
+            self.entangled_pairs.add((qubit1_id, qubit2_id))
+            return True
+        return False
+
+    def probability_one(self, qubit_id):
+        """Pravděpodobnost naměření |1> na daném qubitu"""
+        axis = self._axis(qubit_id)
+        ones = self._tensor()[(slice(None),) * axis + (1,)]
+        return float(np.vdot(ones, ones).real)
+
+    def get_qubit_state(self, qubit_id):
+        """Vrátí stav qubitu ve tvaru QuantumSimulator (bez kolapsu)"""
+        p1 = self.probability_one(qubit_id)
+        return {
+            'state': int(p1 > 0.5),
+            'superposition': 1e-12 < p1 < 1 - 1e-12,
+            'phase': 0.0
+        }
+
+    def measure(self, qubit_id):
+        """Změří qubit a kolabuje statevector"""
+        if qubit_id not in self.qubits:
+            return None
+
+        axis = self.qubits[qubit_id]
+        p1 = self.probability_one(qubit_id)
+        outcome = int(self.rng.random() < p1)
+
+        # Vynuluj nenaměřenou polovinu a renormalizuj
+        tensor = self._tensor()
+        tensor[(slice(None),) * axis + (1 - outcome,)] = 0
+        norm = math.sqrt(p1 if outcome else 1 - p1)
+        if norm > 0:
+            self.amplitudes /= norm
+
+        return outcome
+
+    def sample(self, shots=1):
+        """Vzorkuje bázové stavy bez kolapsu – vrátí pole (shots, num_qubits) bitů"""
+        probabilities = np.abs(self.amplitudes) ** 2
+        probabilities /= probabilities.sum()
+        indices = self.rng.choice(probabilities.size, size=shots, p=probabilities)
+
+        # Osa 0 je nejvýznamnější bit indexu
+        shifts = np.arange(self.num_qubits - 1, -1, -1)
+        return ((indices[:, None] >> shifts) & 1).astype(np.int8)
+
+    def measure_all(self):
+        """Změří všechny qubity najednou, vrátí (ID, pole stavů)"""
+        qubit_ids = sorted(self.qubits, key=self.qubits.get)
+        bits = self.sample(1)[0]
+
+        # Kolaps do naměřeného bázového stavu
+        index = int(np.dot(bits, 1 << np.arange(self.num_qubits - 1, -1, -1))) if qubit_ids else 0
+        self.amplitudes[:] = 0
+        self.amplitudes[index] = 1
+
+        return qubit_ids, bits
+
+    def quantum_random(self):
+        """Náhodné číslo se stejným rozdělením jako QuantumSimulator"""
+        return float(self.rng.random(2).mean())
+
+    def quantum_random_many(self, count):
+        """Vygeneruje count kvantových náhodných čísel jedním voláním RNG"""
+        return self.rng.random((2, count)).mean(axis=0)
+
+    def reset(self):
+        """Vyprázdní registr"""
+        self.amplitudes = np.ones(1, dtype=np.complex128)
+        self.qubits = {}
+        self.entangled_pairs = set()
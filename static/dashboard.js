@@ -0,0 +1,89 @@
+let logCount = 0;
+
+function addLog(message) {
+    const log = document.getElementById('log');
+    const entry = document.createElement('div');
+    entry.className = 'log-entry';
+    const now = new Date();
+    const timestamp = `[${now.getHours().toString().padStart(2,'0')}:${now.getMinutes().toString().padStart(2,'0')}:${now.getSeconds().toString().padStart(2,'0')}]`;
+    entry.innerHTML = `<span class="timestamp">${timestamp}</span> ${message}`;
+    log.appendChild(entry);
+
+    // Omez na posledních 20 zpráv
+    if (log.children.length > 20) {
+        log.removeChild(log.children[0]);
+    }
+
+    // Scroll na konec
+    log.scrollTop = log.scrollHeight;
+}
+
+function updateStats(data) {
+    document.getElementById('node-count').textContent = data.nodes;
+    document.getElementById('synapse-count').textContent = data.synapses;
+    document.getElementById('entanglement').textContent = (data.entanglement * 100).toFixed(1) + '%';
+    document.getElementById('memory').textContent = data.memory_patterns;
+    document.getElementById('resonance').textContent = data.resonance || 0;
+
+    // Vizualizace
+    const viz = document.getElementById('viz');
+    if (data.nodes > 0) {
+        viz.innerHTML = `🧠 ${data.nodes} neuronů propojených ${data.synapses} synapsemi ⚡`;
+    }
+}
+
+// Poslední známý stav – stream posílá jen změněné hodnoty
+const state = {};
+
+function connectStream() {
+    if (!window.EventSource) {
+        // Záložní polling (server odpovídá 304, pokud se nic nezměnilo)
+        setInterval(refreshStats, 5000);
+        return;
+    }
+    const source = new EventSource('/api/stream');
+    source.addEventListener('state', (event) => {
+        Object.assign(state, JSON.parse(event.data));
+        updateStats(state);
+    });
+}
+
+async function refreshStats() {
+    try {
+        const response = await fetch('/api/stats');
+        const data = await response.json();
+        updateStats(data);
+    } catch (e) {
+        addLog('❌ Chyba při načítání statistik');
+    }
+}
+
+async function sendTransaction() {
+    const data = 'transakce_' + Date.now();
+    try {
+        const response = await fetch('/api/transaction', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({data: data})
+        });
+        const result = await response.json();
+        addLog(`📤 ${result.message}`);
+        refreshStats();
+    } catch (e) {
+        addLog('❌ Chyba při odesílání transakce');
+    }
+}
+
+async function addNeuron() {
+    try {
+        const response = await fetch('/api/add_node', {method: 'POST'});
+        const result = await response.json();
+        addLog(`🧠 ${result.message}`);
+        refreshStats();
+    } catch (e) {
+        addLog('❌ Chyba při přidávání neuronu');
+    }
+}
+
+// Změny stavu tlačí server (SSE) – první zpráva obsahuje celý stav
+connectStream();
@@ -3,12 +3,53 @@
 NeuroString – Jednoduché webové rozhraní pro Replit
 """
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, abort, jsonify, request, stream_with_context
+import os
+import hmac
+import gzip
+import json
 import random
+import hashlib
+import functools
+import threading
 import time
+import uuid
 from datetime import datetime
+from memory import memory
+from quantum import quantum
+from admission import AdmissionController
+import metrics
+from profiler import profiler
 
-app = Flask(__name__)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Statické soubory obsluhuje _CompressedAsset (předkomprimované, s hashem v názvu)
+app = Flask(__name__, static_folder=None)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+
+# Server-Sent Events – maximální počet zpráv za sekundu na jednoho diváka
+STREAM_MAX_RATE = 2.0
+STREAM_HEARTBEAT = 15.0  # sekundy mezi keep-alive komentáři
+
+# Hromadné transakce (NDJSON) – kolik řádků se předá síti najednou
+TRANSACTION_BATCH_SIZE = 256
+
+# Řízení přístupu – limit na klienta (IP / X-API-Key) a globální limit souběžnosti
+# Vlastní kbelík dostanou jen známé API klíče (čárkami oddělené v NEUROSTRING_API_KEYS)
+API_KEYS = frozenset(key.strip() for key in os.environ.get('NEUROSTRING_API_KEYS', '').split(',') if key.strip())
+admission = AdmissionController(rate=20.0, burst=40, max_concurrency=8,
+                                max_queue=64, queue_timeout=2.0)
+
+# Profilování přes API je povolené jen s tokenem (Authorization: Bearer <token>)
+PROFILE_TOKEN = os.environ.get('NEUROSTRING_PROFILE_TOKEN')
+
+# Identifikace běhu procesu – verze stavu se po restartu opakují
+_BOOT_ID = uuid.uuid4().hex[:8]
 
 # Jednoduchá HTML šablona
 HTML_TEMPLATE = """
@@ -18,146 +59,7 @@ HTML_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>NeuroString • První myslící síť</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-            border-radius: 20px;
-            padding: 30px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }
-        
-        h1 {
-            font-size: 3em;
-            margin-bottom: 10px;
-            background: linear-gradient(to right, #fff, #e0e0ff);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }
-        
-        .subtitle {
-            font-size: 1.2em;
-            opacity: 0.9;
-            margin-bottom: 30px;
-        }
-        
-        .grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-top: 30px;
-        }
-        
-        .card {
-            background: rgba(255, 255, 255, 0.15);
-            border-radius: 15px;
-            padding: 20px;
-            transition: transform 0.3s;
-        }
-        
-        .card:hover {
-            transform: translateY(-5px);
-            background: rgba(255, 255, 255, 0.2);
-        }
-        
-        .card h3 {
-            margin-bottom: 15px;
-            font-size: 1.3em;
-            border-bottom: 2px solid rgba(255,255,255,0.3);
-            padding-bottom: 10px;
-        }
-        
-        .stat {
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 10px;
-            font-size: 1.1em;
-        }
-        
-        .stat .label {
-            opacity: 0.8;
-        }
-        
-        .stat .value {
-            font-weight: bold;
-            background: rgba(255,255,255,0.2);
-            padding: 3px 10px;
-            border-radius: 20px;
-        }
-        
-        .button {
-            background: white;
-            color: #764ba2;
-            border: none;
-            padding: 10px 20px;
-            border-radius: 25px;
-            font-size: 1em;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s;
-            margin-top: 10px;
-        }
-        
-        .button:hover {
-            transform: scale(1.05);
-            box-shadow: 0 5px 20px rgba(0,0,0,0.2);
-        }
-        
-        .network-viz {
-            height: 200px;
-            background: rgba(0,0,0,0.2);
-            border-radius: 10px;
-            margin: 20px 0;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.2em;
-        }
-        
-        .footer {
-            margin-top: 30px;
-            text-align: center;
-            opacity: 0.7;
-            font-size: 0.9em;
-        }
-        
-        .log {
-            background: rgba(0,0,0,0.3);
-            border-radius: 10px;
-            padding: 15px;
-            margin-top: 20px;
-            font-family: monospace;
-            max-height: 200px;
-            overflow-y: auto;
-        }
-        
-        .log-entry {
-            margin-bottom: 5px;
-            border-bottom: 1px solid rgba(255,255,255,0.1);
-            padding-bottom: 5px;
-        }
-        
-        .timestamp {
-            color: #aaffaa;
-            margin-right: 10px;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ css_url }}">
 </head>
 <body>
     <div class="container">
@@ -226,112 +128,189 @@ HTML_TEMPLATE = """
         </div>
     </div>
     
-    <script>
-        let logCount = 0;
-        
-        function addLog(message) {
-            const log = document.getElementById('log');
-            const entry = document.createElement('div');
-            entry.className = 'log-entry';
-            const now = new Date();
-            const timestamp = `[${now.getHours().toString().padStart(2,'0')}:${now.getMinutes().toString().padStart(2,'0')}:${now.getSeconds().toString().padStart(2,'0')}]`;
-            entry.innerHTML = `<span class="timestamp">${timestamp}</span> ${message}`;
-            log.appendChild(entry);
-            
-            // Omez na posledních 20 zpráv
-            if (log.children.length > 20) {
-                log.removeChild(log.children[0]);
-            }
-            
-            // Scroll na konec
-            log.scrollTop = log.scrollHeight;
-        }
-        
-        function updateStats(data) {
-            document.getElementById('node-count').textContent = data.nodes;
-            document.getElementById('synapse-count').textContent = data.synapses;
-            document.getElementById('entanglement').textContent = (data.entanglement * 100).toFixed(1) + '%';
-            document.getElementById('memory').textContent = data.memory_patterns;
-            document.getElementById('resonance').textContent = data.resonance || 0;
-            
-            // Vizualizace
-            const viz = document.getElementById('viz');
-            if (data.nodes > 0) {
-                viz.innerHTML = `🧠 ${data.nodes} neuronů propojených ${data.synapses} synapsemi ⚡`;
-            }
-        }
-        
-        async function refreshStats() {
-            try {
-                const response = await fetch('/api/stats');
-                const data = await response.json();
-                updateStats(data);
-            } catch (e) {
-                addLog('❌ Chyba při načítání statistik');
-            }
-        }
-        
-        async function sendTransaction() {
-            const data = 'transakce_' + Date.now();
-            try {
-                const response = await fetch('/api/transaction', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({data: data})
-                });
-                const result = await response.json();
-                addLog(`📤 ${result.message}`);
-                refreshStats();
-            } catch (e) {
-                addLog('❌ Chyba při odesílání transakce');
-            }
-        }
-        
-        async function addNeuron() {
-            try {
-                const response = await fetch('/api/add_node', {method: 'POST'});
-                const result = await response.json();
-                addLog(`🧠 ${result.message}`);
-                refreshStats();
-            } catch (e) {
-                addLog('❌ Chyba při přidávání neuronu');
-            }
-        }
-        
-        // Aktualizuj každých 5 sekund
-        setInterval(refreshStats, 5000);
-        
-        // První načtení
-        refreshStats();
-    </script>
+    <script src="{{ js_url }}"></script>
 </body>
 </html>
 """
 
+def _negotiate_encoding(available):
+    """Vybere nejlepší kódování podle Accept-Encoding (br > gzip > identity)"""
+    accepted = request.accept_encodings
+    for encoding in ('br', 'gzip'):
+        if encoding in available and accepted.quality(encoding) > 0:
+            return encoding
+    return 'identity'
+
+class _CompressedAsset:
+    """Obsah odpovědi předkomprimovaný při vytvoření – obsluha je jen kopie bajtů"""
+    
+    def __init__(self, body, content_type, cache_control):
+        if isinstance(body, str):
+            body = body.encode()
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.digest = hashlib.sha256(body).hexdigest()
+        self.encodings = {'identity': body}
+        
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) < len(body):
+            self.encodings['gzip'] = compressed
+        if brotli is not None:
+            compressed = brotli.compress(body, quality=11)
+            if len(compressed) < len(body):
+                self.encodings['br'] = compressed
+    
+    def response(self):
+        encoding = _negotiate_encoding(self.encodings)
+        response = Response(self.encodings[encoding], content_type=self.content_type)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = self.cache_control
+        response.set_etag(f"{self.digest[:16]}-{encoding}")
+        return response.make_conditional(request)
+
+def _load_static(filename, content_type):
+    """Načte statický soubor a zaregistruje ho pod názvem s hashem obsahu"""
+    with open(os.path.join(STATIC_DIR, filename), 'rb') as f:
+        asset = _CompressedAsset(f.read(), content_type, IMMUTABLE_CACHE)
+    name, ext = os.path.splitext(filename)
+    hashed = f"{name}.{asset.digest[:10]}{ext}"
+    STATIC_ASSETS[hashed] = asset
+    return f"/static/{hashed}"
+
+STATIC_ASSETS = {}  # {název s hashem: _CompressedAsset}
+CSS_URL = _load_static('dashboard.css', 'text/css; charset=utf-8')
+JS_URL = _load_static('dashboard.js', 'application/javascript; charset=utf-8')
+
+# Šablona se zkompiluje jednou při importu
+_index_template = app.jinja_env.from_string(HTML_TEMPLATE)
+_index_lock = threading.Lock()
+_index_cache = {'timestamp': None, 'asset': None}
+
+def _client_key():
+    """Klíč pro rate limiting – známý API klíč, jinak IP adresa klienta
+
+    Neověřený X-API-Key se ignoruje – jinak by si klient změnou hlavičky
+    vyrobil nový kbelík a náhodnými klíči vytlačoval ostatní z LRU.
+    """
+    api_key = request.headers.get('X-API-Key')
+    if api_key and api_key in API_KEYS:
+        return 'key:' + api_key
+    return request.remote_addr or 'unknown'
+
+def admitted(view):
+    """Dekorátor – požadavek projde jen přes řízení přístupu (jinak 429/503)"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        rejection = admission.admit(_client_key())
+        if rejection is not None:
+            status, retry_after = rejection
+            response = jsonify({
+                'success': False,
+                'message': '⏳ Příliš mnoho požadavků' if status == 429 else '⚠️  Síť je přetížená'
+            })
+            response.status_code = status
+            response.headers['Retry-After'] = str(retry_after)
+            return response
+        
+        try:
+            response = app.make_response(view(*args, **kwargs))
+        except Exception:
+            admission.release()
+            raise
+        
+        # Slot se uvolní až po odeslání celé odpovědi (i streamované)
+        response.call_on_close(admission.release)
+        return response
+    return wrapper
+
 @app.route('/')
 def index():
-    """Hlavní stránka"""
-    from datetime import datetime
-    return render_template_string(HTML_TEMPLATE, timestamp=datetime.now().strftime('%H:%M:%S'))
+    """Hlavní stránka (vykreslí a zkomprimuje se nejvýše jednou za sekundu)"""
+    timestamp = datetime.now().strftime('%H:%M:%S')
+    with _index_lock:
+        if _index_cache['timestamp'] != timestamp:
+            html = _index_template.render(timestamp=timestamp, css_url=CSS_URL, js_url=JS_URL)
+            _index_cache['asset'] = _CompressedAsset(html, 'text/html; charset=utf-8', 'no-cache')
+            _index_cache['timestamp'] = timestamp
+        asset = _index_cache['asset']
+    return asset.response()
+
+@app.route('/static/<path:filename>')
+def static_asset(filename):
+    """Statické soubory s hashem v názvu – cachovatelné navždy"""
+    asset = STATIC_ASSETS.get(filename)
+    if asset is None:
+        abort(404)
+    return asset.response()
+
+def _state_version():
+    """Verze stavu – mění se s každou změnou sítě, paměti nebo provázání"""
+    return (getattr(network, 'version', 0), memory.version, quantum.version)
+
+def _state_etag(version):
+    return f"{_BOOT_ID}-" + "-".join(str(v) for v in version)
+
+_snapshot_lock = threading.Lock()
+_snapshot = {'version': None, 'state': None}
+
+def _state_snapshot():
+    """Vrátí (verze, stav) – stav se počítá jen jednou pro každou verzi"""
+    version = _state_version()
+    with _snapshot_lock:
+        if _snapshot['version'] != version:
+            stats = network.get_network_state()
+            stats['resonance'] = memory.stats()['resonance_groups']
+            stats['entanglement_groups'] = quantum.entanglement_stats()
+            _snapshot['version'] = version
+            _snapshot['state'] = stats
+        return _snapshot['version'], _snapshot['state']
 
 @app.route('/api/stats')
 def api_stats():
-    """API pro získání statistik"""
-    try:
-        from network import network
-        stats = network.get_network_state()
-        return jsonify(stats)
-    except:
-        # Simulovaná data
-        return jsonify({
-            'nodes': 3,
-            'synapses': 5,
-            'entanglement': 0.73,
-            'memory_patterns': 12,
-            'resonance': 4
-        })
+    """API pro získání statistik (ETag podle verze stavu)"""
+    etag = _state_etag(_state_version())
+    if etag in request.if_none_match:
+        # Nic se nezměnilo – levná odpověď bez těla
+        response = Response(status=304)
+    else:
+        version, stats = _state_snapshot()
+        etag = _state_etag(version)
+        response = jsonify(stats)
+    
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/api/stream')
+def api_stream():
+    """Server-Sent Events – posílá změny stavu, nejvýše STREAM_MAX_RATE za sekundu"""
+    def events():
+        sent_state = {}
+        sent_version = None
+        last_write = time.monotonic()
+        
+        while True:
+            if _state_version() != sent_version:
+                version, state = _state_snapshot()
+                delta = {key: value for key, value in state.items()
+                         if key not in sent_state or sent_state[key] != value}
+                sent_state, sent_version = state, version
+                last_write = time.monotonic()
+                yield f"id: {_state_etag(version)}\nevent: state\ndata: {json.dumps(delta)}\n\n"
+            elif time.monotonic() - last_write >= STREAM_HEARTBEAT:
+                last_write = time.monotonic()
+                yield ": keep-alive\n\n"
+            
+            # Koalescence – změny mezi dvěma zprávami se sloučí do jedné
+            time.sleep(1.0 / STREAM_MAX_RATE)
+    
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/transaction', methods=['POST'])
+@admitted
 def api_transaction():
     """API pro odeslání transakce"""
     data = request.json.get('data', 'test')
@@ -347,7 +326,52 @@ def api_transaction():
             'message': f'✅ Transakce zpracována | Otisk: {hash(data)[:10]}'
         })
 
+def _read_ndjson(stream):
+    """Čte NDJSON po řádcích – tělo požadavku se nikdy nenačte celé"""
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            payload = json.loads(line)
+        except ValueError as e:
+            yield line_no, None, f'Neplatný JSON: {e}'
+            continue
+        data = payload.get('data', 'test') if isinstance(payload, dict) else payload
+        yield line_no, data, None
+
+def _process_batch(batch):
+    """Předá dávku síti a vrací jeden NDJSON řádek na transakci"""
+    # Celá dávka proběhne pod zámkem sítě, odpověď se streamuje až po něm
+    results = iter(network.process_transactions([data for _, data, error in batch if error is None]))
+    for line_no, data, error in batch:
+        if error is None:
+            line = {'line': line_no, 'success': True, 'message': next(results)}
+        else:
+            line = {'line': line_no, 'success': False, 'error': error}
+        yield json.dumps(line, ensure_ascii=False) + '\n'
+
+@app.route('/api/transactions', methods=['POST'])
+@admitted
+def api_transactions():
+    """API pro hromadné transakce – NDJSON dovnitř, NDJSON ven (streamovaně)"""
+    stream = request.stream
+    
+    def results():
+        batch = []
+        for item in _read_ndjson(stream):
+            batch.append(item)
+            if len(batch) >= TRANSACTION_BATCH_SIZE:
+                yield from _process_batch(batch)
+                batch = []
+        if batch:
+            yield from _process_batch(batch)
+    
+    # Bez Content-Length – odpověď jde ven chunked po jednotlivých řádcích
+    return Response(stream_with_context(results()), mimetype='application/x-ndjson')
+
 @app.route('/api/add_node', methods=['POST'])
+@admitted
 def api_add_node():
     """API pro přidání uzlu"""
     try:
@@ -367,6 +391,72 @@ def api_add_node():
             'message': 'Přidán nový neuron (simulace)'
         })
 
+@app.route('/api/admission')
+def api_admission():
+    """API pro metriky řízení přístupu (fronta, odmítnuté požadavky)"""
+    return jsonify(admission.stats())
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Metriky v textovém formátu Prometheus"""
+    return Response(metrics.REGISTRY.expose(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+def _profile_authorized():
+    """Ověří token pro profilování (bez tokenu v prostředí je API vypnuté)"""
+    if not PROFILE_TOKEN:
+        return False
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    return scheme == 'Bearer' and hmac.compare_digest(token.encode(), PROFILE_TOKEN.encode())
+
+@app.route('/api/profile', methods=['GET', 'POST', 'DELETE'])
+def api_profile():
+    """API pro profilování – POST spustí, GET vrátí stav, DELETE ukončí"""
+    if not _profile_authorized():
+        return jsonify({'success': False, 'message': '🔒 Profilování není povoleno'}), 403
+    
+    if request.method == 'GET':
+        status = profiler.status()
+        if status['error']:
+            return jsonify({'success': False, 'message': f"❌ Profilování selhalo: {status['error']}", **status}), 500
+        return jsonify(status)
+    if request.method == 'DELETE':
+        result = profiler.stop()
+        if result is None or 'error' in result:
+            error = result['error'] if result else 'žádný výsledek'
+            return jsonify({'success': False, 'message': f"❌ Profilování selhalo: {error}", 'result': result}), 500
+        return jsonify({'success': True, 'result': result})
+    
+    options = request.get_json(silent=True) or {}
+    try:
+        started = profiler.start(seconds=options.get('seconds', 10),
+                                 hz=options.get('hz', 100),
+                                 trace_memory=bool(options.get('memory', True)))
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'message': '❌ Neplatné parametry'}), 400
+    
+    if not started:
+        return jsonify({'success': False, 'message': '⏳ Profilování už běží'}), 409
+    return jsonify({'success': True, 'message': '📈 Profilování spuštěno'}), 202
+
+def _register_gauges():
+    """Ukazatele vyhodnocované až při sběru – velikosti indexů a řízení přístupu"""
+    metrics.gauge('neurostring_nodes', 'Počet uzlů v síti', lambda: len(getattr(network, 'nodes', ())))
+    metrics.gauge('neurostring_transactions', 'Počet zpracovaných transakcí',
+                  lambda: getattr(network, 'transaction_count', 0))
+    metrics.gauge('neurostring_memory_patterns', 'Počet vzorů v paměti', lambda: len(memory.vibrations))
+    metrics.gauge('neurostring_memory_resonance_groups', 'Počet rezonančních skupin',
+                  lambda: len(memory.resonance_map))
+    metrics.gauge('neurostring_qubits', 'Počet qubitů v registru', lambda: len(quantum.qubits))
+    metrics.gauge('neurostring_entanglement_groups', 'Počet skupin provázání',
+                  lambda: quantum.entanglement_stats()['groups'])
+    
+    for name in ('admitted', 'rejected_rate_limit', 'rejected_queue_full', 'rejected_timeout'):
+        metrics.counter(f'neurostring_admission_{name}_total', f'Řízení přístupu: {name}',
+                        lambda name=name: admission.stats()[name])
+    for name in ('in_flight', 'queue_depth', 'max_queue_depth'):
+        metrics.gauge(f'neurostring_admission_{name}', f'Řízení přístupu: {name}',
+                      lambda name=name: admission.stats()[name])
+
 # Pokud nejsou moduly dostupné, vytvoř globální proměnné
 try:
     from network import network
@@ -382,5 +472,9 @@ except:
             }
         def process_transaction(self, data):
             return f"✅ Transakce zpracována | Otisk: {hash(data)}"
+        def process_transactions(self, items):
+            return [self.process_transaction(data) for data in items]
     
     network = DummyNetwork()
+
+_register_gauges()